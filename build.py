@@ -1,10 +1,22 @@
 #!/usr/bin/env python3
+import asyncio
+import hashlib
+import json
 import os
-import subprocess
 import sys
 import shutil
 from pathlib import Path
 
+CACHE_FILE = Path(".build-cache.json")
+SPEC_FILE = Path("OpenBlueFilter.spec")
+
+# Where OpenBlueFilter.spec writes its output: a one-folder build and a one-file portable build
+DIST_DIR = Path("dist")
+EXE_SUFFIX = ".exe" if sys.platform == 'win32' else ""
+APP_EXE = DIST_DIR / "OpenBlueFilter" / f"OpenBlueFilter{EXE_SUFFIX}"
+PORTABLE_EXE = DIST_DIR / f"OpenBlueFilter_Portable{EXE_SUFFIX}"
+BUILD_ARTIFACTS = [APP_EXE, PORTABLE_EXE]
+
 def check_prerequisites():
     """Check if all required tools are installed"""
     print("Checking prerequisites...")
@@ -17,6 +29,13 @@ def check_prerequisites():
         print("✗ PyInstaller is not installed. Please install it with 'pip install pyinstaller'")
         return False
     
+    # UPX is optional, PyInstaller uses it to compress the bundle when found
+    if shutil.which("upx") or os.environ.get("UPX_DIR"):
+        print("✓ UPX is available, the bundle will be compressed")
+    else:
+        print("⚠ UPX not found. The executable will be larger.")
+        print("  Download it from https://upx.github.io/ and add it to PATH or set UPX_DIR.")
+    
     # Check if Inno Setup is installed (for Windows only)
     if sys.platform == 'win32':
         inno_path = Path("C:/Program Files (x86)/Inno Setup 6/ISCC.exe")
@@ -31,28 +50,120 @@ def check_prerequisites():
 def clean_build_dir():
     """Clean up previous build directories"""
     print("Cleaning up previous build files...")
-    for path in ["build", "dist"]:
-        if os.path.exists(path):
+    for path in ["build", DIST_DIR]:
+        try:
             shutil.rmtree(path)
             print(f"✓ Removed {path} directory")
+        except FileNotFoundError:
+            pass
+
+def _pyinstaller_version():
+    """Return the installed PyInstaller version, or None if it isn't installed"""
+    try:
+        import PyInstaller
+    except ImportError:
+        return None
+    return PyInstaller.__version__
+
+def compute_inputs_hash():
+    """Hash every file and tool version that feeds into the PyInstaller build
+    
+    Raises FileNotFoundError if an input is missing, since the build can't run without it.
+    """
+    inputs = sorted(Path("src").rglob("*.py"))
+    inputs += sorted(p for p in Path("resources").glob("*") if p.is_file())
+    inputs += [SPEC_FILE, Path("version_info.txt"), Path("requirements.txt")]
+    
+    digest = hashlib.sha256()
+    for path in inputs:
+        digest.update(path.as_posix().encode())
+        digest.update(path.read_bytes())
+    
+    # A different interpreter or PyInstaller produces a different bundle
+    digest.update(sys.version.encode())
+    digest.update(str(_pyinstaller_version()).encode())
+    return digest.hexdigest()
+
+def load_build_cache():
+    """Load the cache entry from the last successful build, if any"""
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-def build_executable():
+def save_build_cache(inputs_hash):
+    """Record the inputs hash of a successful build"""
+    with open(CACHE_FILE, 'w') as f:
+        json.dump({"hash": inputs_hash}, f, indent=4)
+
+def is_build_cached(inputs_hash):
+    """Check whether the previous build is still valid for these inputs"""
+    cache = load_build_cache()
+    if cache.get("hash") != inputs_hash:
+        return False
+    return all(path.exists() for path in BUILD_ARTIFACTS)
+
+async def _stream_output(stream, sink):
+    """Forward a subprocess stream line by line instead of buffering it all"""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        sink.write(line.decode(errors="replace"))
+        sink.flush()
+
+async def _run_command(*cmd):
+    """Run a command, streaming stdout/stderr as it arrives, and return its exit code"""
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    
+    await asyncio.gather(
+        _stream_output(process.stdout, sys.stdout),
+        _stream_output(process.stderr, sys.stderr)
+    )
+    return await process.wait()
+
+def _run_pyinstaller_in_process(args):
+    """Run PyInstaller inside this interpreter and return an exit code"""
+    import PyInstaller.__main__
+    
+    try:
+        PyInstaller.__main__.run(args)
+    except SystemExit as e:
+        # Same as the interpreter: None is success, any other non-int is a failure
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        print(f"✗ PyInstaller raised an error: {e}")
+        return 1
+    return 0
+
+async def build_executable():
     """Build the executable using PyInstaller"""
     print("Building executable with PyInstaller...")
     
-    # Run PyInstaller
-    result = subprocess.run(["pyinstaller", "OpenBlueFilter.spec"], 
-                           capture_output=True, text=True)
+    # Run PyInstaller in-process to skip a fresh interpreter start-up, falling
+    # back to the command line tool if it can't be imported
+    try:
+        import PyInstaller.__main__
+    except ImportError:
+        returncode = await _run_command("pyinstaller", str(SPEC_FILE))
+    else:
+        returncode = _run_pyinstaller_in_process([str(SPEC_FILE)])
     
-    if result.returncode != 0:
-        print("✗ PyInstaller failed:")
-        print(result.stderr)
+    if returncode != 0:
+        print("✗ PyInstaller failed (see output above)")
         return False
     
     print("✓ PyInstaller completed successfully")
     return True
 
-def create_installer():
+async def create_installer():
     """Create installer using Inno Setup (Windows only)"""
     if sys.platform != 'win32':
         print("Skipping installer creation (not on Windows)")
@@ -71,35 +182,54 @@ def create_installer():
         return False
     
     # Run Inno Setup Compiler
-    result = subprocess.run([str(inno_path), "installer.iss"], 
-                           capture_output=True, text=True)
+    returncode = await _run_command(str(inno_path), "installer.iss")
     
-    if result.returncode != 0:
-        print("✗ Inno Setup compilation failed:")
-        print(result.stderr)
+    if returncode != 0:
+        print("✗ Inno Setup compilation failed (see output above)")
         return False
     
     print("✓ Installer created successfully")
     return True
 
-def main():
-    """Main build process"""
-    print("===== OpenBlueFilter Build Script =====")
+async def main_async():
+    """Asynchronous build pipeline"""
+    try:
+        inputs_hash = compute_inputs_hash()
+    except FileNotFoundError as e:
+        print(f"✗ Build input not found: {e.filename}")
+        return False
+    
+    if is_build_cached(inputs_hash):
+        print("✓ Sources unchanged since the last build (cache hit), skipping PyInstaller")
+        if not check_prerequisites():
+            return False
+        await create_installer()
+        return True
     
+    # Only wipe the previous build once we know a new one can be made
     if not check_prerequisites():
-        sys.exit(1)
+        return False
     
     clean_build_dir()
     
-    if not build_executable():
-        sys.exit(1)
+    if not await build_executable():
+        return False
     
-    create_installer()
+    save_build_cache(inputs_hash)
+    await create_installer()
+    return True
+
+def main():
+    """Main build process"""
+    print("===== OpenBlueFilter Build Script =====")
+    
+    if not asyncio.run(main_async()):
+        sys.exit(1)
     
     print("\nBuild completed!")
-    print("Files created in the 'dist' directory:")
-    print("- OpenBlueFilter/OpenBlueFilter.exe: Executable with supporting files")
-    print("- OpenBlueFilter_Portable.exe: Single-file executable")
+    print(f"Files created in the '{DIST_DIR}' directory:")
+    print(f"- {APP_EXE.relative_to(DIST_DIR).as_posix()}: Executable with supporting files")
+    print(f"- {PORTABLE_EXE.relative_to(DIST_DIR).as_posix()}: Single-file executable")
     if sys.platform == 'win32':
         print("- OpenBlueFilter_Setup.exe: Installer (if Inno Setup was available)")
     
@@ -109,4 +239,4 @@ def main():
     print("3. Zip and share the entire OpenBlueFilter folder")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,19 +1,50 @@
 #!/usr/bin/env python3
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageOps
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+import numpy as np
 import os
 import math
+from concurrent.futures import ThreadPoolExecutor
 
-def create_logo(size=256, enabled=False):
+# Resolution the logo is rasterized at before downsampling (2x the largest icon)
+MASTER_SIZE = 512
+
+# (cos, sin) of the fixed filter-line angles: 60, 120 and 180 degrees
+_FILTER_DIRS = [
+    (math.cos(math.radians(60 * (i + 1))), math.sin(math.radians(60 * (i + 1))))
+    for i in range(3)
+]
+
+def _radial_gradient(image_size, center, radius, color):
     """
-    Create the OpenBlueFilter logo with anti-aliasing for higher quality
+    Build an RGBA layer with a radial alpha gradient, fading out towards the center
     
     Args:
-        size: Size of the logo in pixels
-        enabled: Whether to create the enabled or disabled version
+        image_size: Width and height of the layer in pixels
+        center: Center of the gradient in pixels
+        radius: Radius of the gradient disc in pixels
+        color: RGB color of the gradient
     """
-    # Create a larger image for better quality, then resize down
-    large_size = size * 2
+    yy, xx = np.ogrid[:image_size, :image_size]
+    distance = np.sqrt((xx - center) ** 2 + (yy - center) ** 2)
+    
+    # Same falloff as drawing concentric ellipses from the outside in
+    ring = np.maximum(np.ceil(distance - 0.5), 1)
+    alpha = 150 - (150 * (radius - ring) / radius).astype(np.int32)
+    alpha = np.where(distance <= radius + 0.5, np.clip(alpha, 0, 150), 0)
     
+    layer = np.empty((image_size, image_size, 4), dtype=np.uint8)
+    layer[..., :3] = color[:3]
+    layer[..., 3] = alpha
+    return Image.fromarray(layer, 'RGBA')
+
+def _render_master(enabled=False, large_size=MASTER_SIZE):
+    """
+    Rasterize the OpenBlueFilter logo at full resolution, ready for downsampling
+    
+    Args:
+        enabled: Whether to create the enabled or disabled version
+        large_size: Size of the rendered image in pixels
+    """
     # Create a transparent image with RGBA mode
     img = Image.new('RGBA', (large_size, large_size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -42,58 +73,68 @@ def create_logo(size=256, enabled=False):
     )
     
     # Draw inner filter effect with gradient
-    for r in range(inner_radius, 0, -1):
-        alpha = 150 - int(150 * (inner_radius - r) / inner_radius)
-        color = inner_color[:3] + (alpha,)
-        draw.ellipse(
-            (center - r, center - r, center + r, center + r),
-            fill=color,
-            outline=None
-        )
+    img.alpha_composite(_radial_gradient(large_size, center, inner_radius, inner_color))
     
     # Draw filter lines
-    for i in range(3):
-        angle = math.radians(60 * (i + 1))
-        x1 = center + int(math.cos(angle) * (inner_radius - line_width))
-        y1 = center + int(math.sin(angle) * (inner_radius - line_width))
-        x2 = center + int(math.cos(angle) * (inner_radius + line_length))
-        y2 = center + int(math.sin(angle) * (inner_radius + line_length))
+    for cos_a, sin_a in _FILTER_DIRS:
+        x1 = center + int(cos_a * (inner_radius - line_width))
+        y1 = center + int(sin_a * (inner_radius - line_width))
+        x2 = center + int(cos_a * (inner_radius + line_length))
+        y2 = center + int(sin_a * (inner_radius + line_length))
         
-        # Draw thicker lines for better visibility
-        for offset in range(-line_width, line_width + 1):
-            draw.line(
-                (x1, y1 + offset, x2, y2 + offset),
-                fill=outer_color,
-                width=3
-            )
+        # Draw thicker lines for better visibility: one polygon covering the
+        # band swept by shifting the line vertically by +/- line_width
+        draw.polygon(
+            [(x1, y1 - line_width - 1), (x2, y2 - line_width - 1),
+             (x2, y2 + line_width + 1), (x1, y1 + line_width + 1)],
+            fill=outer_color
+        )
     
-    # Apply a slight blur for smoother edges
-    img = img.filter(ImageFilter.GaussianBlur(radius=1))
+    # No blur pass needed: the LANCZOS downsample already anti-aliases the edges
+    return img
+
+def create_logo(size=256, enabled=False, master=None):
+    """
+    Create the OpenBlueFilter logo with anti-aliasing for higher quality
     
-    # Resize down to the desired size for a cleaner look
-    img = img.resize((size, size), Image.LANCZOS)
+    Args:
+        size: Size of the logo in pixels
+        enabled: Whether to create the enabled or disabled version
+        master: Optional pre-rendered master image to downsample from
+    """
+    # Create a larger image for better quality, then resize down
+    if master is None:
+        master = _render_master(enabled, size * 2)
     
-    return img
+    # Resize down to the desired size for a cleaner look
+    return master.resize((size, size), Image.LANCZOS)
 
 def main():
     # Ensure resources directory exists
     resources_dir = os.path.join(os.path.dirname(__file__), 'resources')
     os.makedirs(resources_dir, exist_ok=True)
     
-    # Create standard icon
-    std_icon = create_logo(size=256, enabled=False)
-    std_icon.save(os.path.join(resources_dir, 'icon.png'))
-    
-    # Create enabled icon
-    enabled_icon = create_logo(size=256, enabled=True)
-    enabled_icon.save(os.path.join(resources_dir, 'icon_enabled.png'))
+    # Render each variant once and downsample it for both icon sizes
+    std_master = _render_master(enabled=False)
+    enabled_master = _render_master(enabled=True)
     
-    # Create smaller icons for UI
-    std_icon_small = create_logo(size=64, enabled=False)
-    std_icon_small.save(os.path.join(resources_dir, 'icon_small.png'))
+    icons = [
+        # Standard and enabled icons
+        (create_logo(size=256, master=std_master), 'icon.png'),
+        (create_logo(size=256, master=enabled_master), 'icon_enabled.png'),
+        # Smaller icons for UI
+        (create_logo(size=64, master=std_master), 'icon_small.png'),
+        (create_logo(size=64, master=enabled_master), 'icon_enabled_small.png'),
+    ]
     
-    enabled_icon_small = create_logo(size=64, enabled=True)
-    enabled_icon_small.save(os.path.join(resources_dir, 'icon_enabled_small.png'))
+    # PNG encoding releases the GIL, so the files can be written in parallel
+    with ThreadPoolExecutor(max_workers=len(icons)) as executor:
+        futures = [
+            executor.submit(icon.save, os.path.join(resources_dir, filename))
+            for icon, filename in icons
+        ]
+        for future in futures:
+            future.result()
     
     print("Logo files generated successfully in the resources directory")
 
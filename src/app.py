@@ -2,12 +2,6 @@ import logging
 import sys
 from PyQt6.QtWidgets import QMainWindow
 
-from .ui.main_window import MainWindow
-from .ui.tray_icon import TrayIcon
-from .utils.config import ConfigManager
-from .filter_engine.filter_manager import get_filter_manager
-from .profiles.profile_manager import ProfileManager
-
 class OpenBlueFilterApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -24,6 +18,13 @@ class OpenBlueFilterApp(QMainWindow):
         self.logger.info("Application initialized successfully")
     
     def _init_components(self):
+        # Import components here so only what is actually used gets loaded
+        from .ui.main_window import MainWindow
+        from .ui.tray_icon import TrayIcon
+        from .utils.config import ConfigManager
+        from .filter_engine.filter_manager import get_filter_manager
+        from .profiles.profile_manager import ProfileManager
+        
         # Create configuration manager
         self.config_manager = ConfigManager()
         
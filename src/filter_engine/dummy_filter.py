@@ -21,14 +21,10 @@ class DummyFilterManager(AbstractFilterManager):
         self.config_manager.set("filter_enabled", False)
         return True
     
-    def set_intensity(self, value):
-        self.logger.info(f"Dummy filter intensity set to {value} (no actual effect)")
-        self._intensity = max(0.0, min(1.0, float(value)))
-        self.config_manager.set("intensity", self._intensity)
+    def _apply_intensity_hook(self):
+        self.logger.info(f"Dummy filter intensity set to {self._intensity} (no actual effect)")
         return True
     
-    def set_color_temperature(self, value):
-        self.logger.info(f"Dummy filter color temperature set to {value}K (no actual effect)")
-        self._color_temperature = max(1000, min(6500, int(value)))
-        self.config_manager.set("color_temperature", self._color_temperature)
-        return True 
\ No newline at end of file
+    def _apply_temp_hook(self):
+        self.logger.info(f"Dummy filter color temperature set to {self._color_temperature}K (no actual effect)")
+        return True
\ No newline at end of file
@@ -1,6 +1,11 @@
 import logging
+import math
+import platform
 from abc import ABC, abstractmethod
 
+# The platform cannot change while the process runs, so probe it only once
+_SYSTEM = platform.system().lower()
+
 class AbstractFilterManager(ABC):
     def __init__(self, config_manager):
         self.logger = logging.getLogger(__name__)
@@ -19,15 +24,42 @@ class AbstractFilterManager(ABC):
         """Disable the blue light filter"""
         pass
     
-    @abstractmethod
+    @staticmethod
+    def _clamp_intensity(value):
+        """Clamp an intensity value to the 0.0 to 1.0 range"""
+        value = float(value)
+        # NaN fails every comparison, so it would pass through any clamp unchanged
+        if math.isnan(value):
+            raise ValueError("Filter intensity must be a number, got NaN")
+        return min(max(value, 0.0), 1.0)
+    
+    @staticmethod
+    def _clamp_temp(value):
+        """Clamp a color temperature to a reasonable range (1000K to 6500K)"""
+        value = float(value)
+        if math.isnan(value):
+            raise ValueError("Color temperature must be a number, got NaN")
+        return int(min(max(value, 1000.0), 6500.0))
+    
     def set_intensity(self, value):
         """Set the filter intensity (0.0 to 1.0)"""
-        pass
+        self._intensity = self._clamp_intensity(value)
+        self.config_manager.set("intensity", self._intensity, persist=False)
+        return self._apply_intensity_hook()
     
-    @abstractmethod
     def set_color_temperature(self, value):
         """Set the color temperature in Kelvin"""
-        pass
+        self._color_temperature = self._clamp_temp(value)
+        self.config_manager.set("color_temperature", self._color_temperature, persist=False)
+        return self._apply_temp_hook()
+    
+    def _apply_intensity_hook(self):
+        """Apply a changed intensity to the platform filter"""
+        return True
+    
+    def _apply_temp_hook(self):
+        """Apply a changed color temperature to the platform filter"""
+        return True
     
     def is_enabled(self):
         """Check if the filter is currently enabled"""
@@ -42,37 +74,37 @@ class AbstractFilterManager(ABC):
     
     def apply_config(self):
         """Apply the current configuration settings"""
-        self._intensity = self.config_manager.get("intensity", 0.5)
-        self._color_temperature = self.config_manager.get("color_temperature", 3500)
+        get = self.config_manager.get
+        self._intensity = get("intensity", 0.5)
+        self._color_temperature = get("color_temperature", 3500)
+        filter_enabled = get("filter_enabled", False)
         
-        # Apply the settings
-        self.set_intensity(self._intensity)
-        self.set_color_temperature(self._color_temperature)
-        
-        # Enable/disable according to config
-        if self.config_manager.get("filter_enabled", False):
-            self.enable()
-        else:
-            self.disable()
+        # Apply the settings, writing the config file once at the end
+        with self.config_manager.batch():
+            self.set_intensity(self._intensity)
+            self.set_color_temperature(self._color_temperature)
+            
+            # Enable/disable according to config
+            if filter_enabled:
+                self.enable()
+            else:
+                self.disable()
 
 
 def get_filter_manager(config_manager):
     """Factory function to get the appropriate filter manager for the current platform"""
-    import platform
-    system = platform.system().lower()
-    
-    if system == "windows":
+    if _SYSTEM == "windows":
         from .windows_filter import WindowsFilterManager
         return WindowsFilterManager(config_manager)
-    elif system == "darwin":
+    elif _SYSTEM == "darwin":
         # macOS implementation
         from .macos_filter import MacOSFilterManager
         return MacOSFilterManager(config_manager)
-    elif system == "linux":
+    elif _SYSTEM == "linux":
         # Linux implementation
         from .linux_filter import LinuxFilterManager
         return LinuxFilterManager(config_manager)
     else:
         # Fallback to dummy implementation
         from .dummy_filter import DummyFilterManager
-        return DummyFilterManager(config_manager) 
\ No newline at end of file
+        return DummyFilterManager(config_manager)
@@ -21,14 +21,10 @@ class MacOSFilterManager(AbstractFilterManager):
         self.config_manager.set("filter_enabled", False)
         return True
     
-    def set_intensity(self, value):
-        self.logger.info(f"MacOS filter intensity set to {value}")
-        self._intensity = max(0.0, min(1.0, float(value)))
-        self.config_manager.set("intensity", self._intensity)
+    def _apply_intensity_hook(self):
+        self.logger.info(f"MacOS filter intensity set to {self._intensity}")
         return True
     
-    def set_color_temperature(self, value):
-        self.logger.info(f"MacOS filter color temperature set to {value}K")
-        self._color_temperature = max(1000, min(6500, int(value)))
-        self.config_manager.set("color_temperature", self._color_temperature)
-        return True 
\ No newline at end of file
+    def _apply_temp_hook(self):
+        self.logger.info(f"MacOS filter color temperature set to {self._color_temperature}K")
+        return True
\ No newline at end of file
@@ -1,3 +1,4 @@
+import functools
 import logging
 import ctypes
 import math
@@ -17,18 +18,63 @@ class ColorMatrix(Structure):
         ('matrix', (c_float * 5) * 5)
     ]
 
+def _scale_matrix(red=1.0, green=1.0, blue=1.0):
+    # A fresh ColorMatrix is all zeros; only the diagonal needs filling in
+    matrix = ColorMatrix()
+    m = matrix.matrix
+    m[0][0], m[1][1], m[2][2], m[3][3], m[4][4] = red, green, blue, 1.0, 1.0
+    return matrix
+
+@functools.lru_cache(maxsize=128)
+def _build_matrix(intensity_q, temp_q):
+    """
+    Create a color matrix adjusted for intensity and color temperature.
+    
+    Takes the intensity in percent and the color temperature in units of 100K.
+    The returned matrix is shared between callers and must not be modified.
+    """
+    # This is a simplified version - actual implementation would be more sophisticated
+    intensity = intensity_q / 100
+    temp_factor = (6500 - temp_q * 100) / 3800  # Normalize temp to 0-1 range
+    
+    # Clamp values to safe range
+    temp_factor = max(0, min(1, temp_factor))
+    
+    # Reduce blue based on intensity and temperature
+    blue_reduction = intensity * temp_factor
+    
+    # Adjust red slightly higher for warmer appearance
+    red_boost = intensity * temp_factor * 0.3
+    
+    # Adjust color channels
+    return _scale_matrix(
+        red=1.0 + red_boost,  # Red channel (increased slightly)
+        green=1.0 - intensity * 0.1,  # Green channel (reduced slightly)
+        blue=1.0 - blue_reduction,  # Blue channel (reduced based on settings)
+    )
+
 class WindowsFilterManager(AbstractFilterManager):
+    # Shared identity matrix used to remove the filter; never modified
+    _IDENTITY_MATRIX = _scale_matrix()
+    
     def __init__(self, config_manager):
         super().__init__(config_manager)
         self.logger = logging.getLogger(__name__)
         self._magnification_dll = None
         self._matrix = None
+        self._last_applied = (None, None)
         self._initialize_magnification()
         
     def _initialize_magnification(self):
         try:
             # Load the Windows Magnification API
-            self._magnification_dll = ctypes.WinDLL("Magnification.dll")
+            self._magnification_dll = ctypes.WinDLL("Magnification.dll", use_last_error=True)
+            
+            # Declare the prototypes once so ctypes doesn't have to guess per call
+            self._magnification_dll.MagInitialize.restype = ctypes.c_bool
+            self._magnification_dll.MagUninitialize.restype = ctypes.c_bool
+            self._magnification_dll.MagSetFullscreenColorEffect.argtypes = [POINTER(ColorMatrix)]
+            self._magnification_dll.MagSetFullscreenColorEffect.restype = ctypes.c_bool
             
             # Initialize the magnification runtime
             if not self._magnification_dll.MagInitialize():
@@ -46,35 +92,16 @@ class WindowsFilterManager(AbstractFilterManager):
             self._magnification_dll.MagUninitialize()
             self.logger.info("Windows Magnification API uninitialized")
     
+    def _quantized_settings(self):
+        # Quantize to 1% intensity and 100K steps (below what is perceptible) so
+        # the many near-identical values produced by a slider drag hit the cache
+        return round(self._intensity * 100), round(self._color_temperature / 100)
+    
     def _create_color_matrix(self):
-        # Create a color matrix adjusted for intensity and color temperature
-        # This is a simplified version - actual implementation would be more sophisticated
-        intensity = self._intensity
-        temp_factor = (6500 - self._color_temperature) / 3800  # Normalize temp to 0-1 range
-        
-        # Clamp values to safe range
-        temp_factor = max(0, min(1, temp_factor))
-        
-        # Reduce blue based on intensity and temperature
-        blue_reduction = intensity * temp_factor
+        intensity_q, temp_q = self._quantized_settings()
         
-        # Adjust red slightly higher for warmer appearance
-        red_boost = intensity * temp_factor * 0.3
-        
-        matrix = ColorMatrix()
-        
-        # Identity matrix
-        for i in range(5):
-            for j in range(5):
-                matrix.matrix[i][j] = 1.0 if i == j else 0.0
-        
-        # Adjust color channels
-        matrix.matrix[0][0] = 1.0 + red_boost  # Red channel (increased slightly)
-        matrix.matrix[1][1] = 1.0 - (intensity * 0.1)  # Green channel (reduced slightly)
-        matrix.matrix[2][2] = 1.0 - blue_reduction  # Blue channel (reduced based on settings)
-        
-        self._matrix = matrix
-        return matrix
+        self._matrix = _build_matrix(intensity_q, temp_q)
+        return self._matrix
     
     def _apply_color_filter(self, enable=True):
         try:
@@ -83,17 +110,16 @@ class WindowsFilterManager(AbstractFilterManager):
                 result = self._magnification_dll.MagSetFullscreenColorEffect(byref(matrix))
             else:
                 # Use identity matrix to disable the filter
-                matrix = ColorMatrix()
-                for i in range(5):
-                    for j in range(5):
-                        matrix.matrix[i][j] = 1.0 if i == j else 0.0
-                result = self._magnification_dll.MagSetFullscreenColorEffect(byref(matrix))
+                result = self._magnification_dll.MagSetFullscreenColorEffect(byref(self._IDENTITY_MATRIX))
                 
             if not result:
-                error_code = ctypes.GetLastError()
-                self.logger.error(f"Failed to {'apply' if enable else 'remove'} color filter. Error code: {error_code}")
+                # Only the failure path needs the OS error; WinError formats its message
+                error = ctypes.WinError(ctypes.get_last_error())
+                self.logger.error(f"Failed to {'apply' if enable else 'remove'} color filter: {error}")
                 return False
-                
+            
+            # Remember what is on screen so no-change setters can skip the DLL call
+            self._last_applied = self._quantized_settings() if enable else (None, None)
             return True
         except Exception as e:
             self.logger.error(f"Error {'applying' if enable else 'removing'} color filter: {e}")
@@ -115,24 +141,17 @@ class WindowsFilterManager(AbstractFilterManager):
             self.config_manager.set("filter_enabled", False)
         return result
     
-    def set_intensity(self, value):
-        self.logger.info(f"Setting filter intensity to {value}")
-        self._intensity = max(0.0, min(1.0, float(value)))
-        self.config_manager.set("intensity", self._intensity)
-        
-        # Apply the change if filter is enabled
-        if self._enabled:
-            return self._apply_color_filter(True)
-        return True
+    def _apply_intensity_hook(self):
+        self.logger.info(f"Setting filter intensity to {self._intensity}")
+        return self._reapply_if_changed()
     
-    def set_color_temperature(self, value):
-        self.logger.info(f"Setting color temperature to {value}K")
-        # Clamp to a reasonable range (1000K to 6500K)
-        self._color_temperature = max(1000, min(6500, int(value)))
-        self.config_manager.set("color_temperature", self._color_temperature)
-        
-        # Apply the change if filter is enabled
-        if self._enabled:
+    def _apply_temp_hook(self):
+        self.logger.info(f"Setting color temperature to {self._color_temperature}K")
+        return self._reapply_if_changed()
+    
+    def _reapply_if_changed(self):
+        # Apply the change if filter is enabled and it lands on a different quantized matrix
+        if self._enabled and self._quantized_settings() != self._last_applied:
             return self._apply_color_filter(True)
         return True
     
@@ -5,31 +5,49 @@ import logging
 import tkinter as tk
 from tkinter import ttk, Scale, HORIZONTAL, messagebox, simpledialog, font
 import threading
+import atexit
 import time
 import ctypes
+import functools
+import types
 import json
+from contextlib import contextmanager
 from datetime import datetime
 import re
 from pathlib import Path
-from PIL import Image, ImageTk
-import webbrowser
-import schedule
-import pygame
-import pytz
-import random
-import numpy as np
-import colorsys
-import traceback
-import subprocess
-import win32api
-import win32con
-import psutil
+
+# Project paths, resolved once at import
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESOURCES_DIR = os.path.join(_ROOT_DIR, "resources")
+GENERATE_LOGO_PATH = os.path.join(_ROOT_DIR, "generate_logo.py")
+
+def _resource_files():
+    """Map file name to path for every file in RESOURCES_DIR, using a single directory scan"""
+    try:
+        with os.scandir(RESOURCES_DIR) as entries:
+            return {entry.name: entry.path for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return {}
 
 # Add the parent directory to the path so we can import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(_ROOT_DIR)
 
 from src.utils.logger import setup_logger
 
+# Use orjson for the config file when it is installed; both paths write 2-space indented JSON bytes
+try:
+    import orjson
+
+    def _dump_json(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _load_json = orjson.loads
+except ImportError:
+    def _dump_json(data):
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    _load_json = json.loads
+
 # Define color scheme
 COLORS = {
     "background": "#f0f0f0",
@@ -50,7 +68,59 @@ COLORS = {
     "error": "#f44336",
 }
 
+# Built-in profiles created on first run or restored when missing; copy before storing
+DEFAULT_PROFILES = types.MappingProxyType({
+    "Morning": {
+        "intensity": 30,
+        "color_temperature": 5000
+    },
+    "Evening": {
+        "intensity": 50,
+        "color_temperature": 4000
+    },
+    "Night": {
+        "intensity": 70,
+        "color_temperature": 2500
+    }
+})
+
+# Order in which the built-in profiles are listed; other profiles follow alphabetically
+PROFILE_ORDER = ("Morning", "Evening", "Night")
+_PROFILE_ORDER_SET = frozenset(PROFILE_ORDER)
+
+# Default profile for each hour of the day: Morning 6-11, Evening 12-18, Night otherwise
+HOUR_TO_PROFILE = tuple(
+    "Morning" if 6 <= hour < 12 else "Evening" if 12 <= hour < 19 else "Night"
+    for hour in range(24)
+)
+
+# Feature list shown on the About tab
+ABOUT_FEATURES = (
+    "• Adjustable blue light filter intensity",
+    "• Customizable color temperature",
+    "• Saved profiles for different times of day",
+    "• Minimal system resources usage",
+    "• System tray integration for easy access",
+)
+
+# Win32 error codes handled by the filter's retry logic
+ERROR_ACCESS_DENIED = 21
+REINIT_ERROR_CODES = (5, 6, 50, 1812)  # Common error codes for access issues
+
+# Win32 entry points resolved once at import; None on other platforms
+if sys.platform == "win32":
+    _GetLastError = ctypes.windll.kernel32.GetLastError
+    _GetLastError.argtypes = []
+    _GetLastError.restype = ctypes.c_uint
+    _IsUserAnAdmin = ctypes.windll.shell32.IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = []
+    _IsUserAnAdmin.restype = ctypes.c_int
+else:
+    _GetLastError = None
+    _IsUserAnAdmin = None
+
 # Check if the application is running with administrative privileges
+@functools.lru_cache(maxsize=1)
 def is_admin():
     """Check if the program is running with administrator privileges"""
     import logging
@@ -58,23 +128,97 @@ def is_admin():
     
     try:
         # The most reliable method to check admin rights on Windows
-        result = ctypes.windll.shell32.IsUserAnAdmin() != 0
+        result = _IsUserAnAdmin() != 0
         logger.debug(f"Admin check result: {result}")
         return result
     except Exception as e:
         logger.error(f"Error checking admin status: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
+def _system_info_lines():
+    """Platform description for the About tab; platform.processor() can be slow on Windows"""
+    import platform
+    return (
+        f"Platform: {platform.system()} {platform.release()}",
+        f"Python: {platform.python_version()}",
+        f"Processor: {platform.processor()}",
+    )
+
+class ColorMatrix(ctypes.Structure):
+    """MAGCOLOREFFECT: a flattened 5x5 color transformation matrix"""
+    _fields_ = [
+        ("matrix", ctypes.c_float * 25)
+    ]
+
+# Identity color effect (no color change) used to remove the filter; shared and never modified
+_IDENTITY_EFFECT = ColorMatrix((ctypes.c_float * 25)(
+    1.0, 0.0, 0.0, 0.0, 0.0,  # Row 1
+    0.0, 1.0, 0.0, 0.0, 0.0,  # Row 2
+    0.0, 0.0, 1.0, 0.0, 0.0,  # Row 3
+    0.0, 0.0, 0.0, 1.0, 0.0,  # Row 4
+    0.0, 0.0, 0.0, 0.0, 1.0   # Row 5
+))
+
+def _temperature_factor(color_temperature):
+    """Normalize a color temperature in Kelvin to the 0-1 warmth factor"""
+    temp_factor = (6500 - color_temperature) / 5500
+    return max(0.0, min(1.0, temp_factor))
+
+def _channel_scales(intensity, temp_factor):
+    """
+    Return the (red, green, blue) diagonal of the filter matrix.
+    The filter never touches the other 22 cells, which stay at identity.
+    """
+    # Reduce blue based on intensity and temperature
+    blue_reduction = intensity * temp_factor
+    
+    # Adjust red slightly higher for warmer appearance
+    red_boost = intensity * temp_factor * 0.3
+    
+    # Red slightly increased, green slightly reduced, blue reduced based on settings
+    return (1.0 + red_boost, 1.0 - (intensity * 0.1), 1.0 - blue_reduction)
+
+# Quiet window after an applied slider change; further drags within it are
+# folded into a single trailing update
+SLIDER_DEBOUNCE_MS = 150
+
+# Minimum seconds between repeats of the same filter error in the log
+ERROR_LOG_INTERVAL = 5.0
+
+# Minimum seconds between attempts to leave simulation mode
+SIMULATION_RECOVERY_INTERVAL = 300
+
+# Schedule times as typed by the user: "H:MM"/"HH:MM" or four bare digits ("2030")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{1,2})|(\d{2})(\d{2})")
+
 class FilterManager:
+    __slots__ = (
+        "logger", "enabled", "intensity", "color_temperature",
+        "_temp_factor", "_effect", "_effect_scales", "mag_dll", "api_initialized",
+        "_mag_init", "_mag_uninit", "_mag_set", "simulation_mode", "simulation_error_count",
+        "last_real_attempt_time", "_last_error_log",
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.enabled = False
         self.intensity = 0.5
         self.color_temperature = 3500  # Default color temperature in Kelvin
+        self._temp_factor = _temperature_factor(self.color_temperature)
+        # Single effect struct handed to the API; only its RGB diagonal is ever rewritten
+        self._effect = ColorMatrix.from_buffer_copy(_IDENTITY_EFFECT)
+        self._effect_scales = (1.0, 1.0, 1.0)
         self.mag_dll = None
+        self.api_initialized = False
+        self._mag_init = None
+        self._mag_uninit = None
+        self._mag_set = None
         self.simulation_mode = False
         self.simulation_error_count = 0
-        self.last_real_attempt_time = 0  # Track when we last tried to use the real API
+        # Monotonic time of the last attempt to use the real API; starts out due
+        self.last_real_attempt_time = -SIMULATION_RECOVERY_INTERVAL
+        self._last_error_log = {}  # Error key -> monotonic time it was last logged
         self._initialize_magnification()
     
     def _initialize_magnification(self):
@@ -87,9 +231,20 @@ class FilterManager:
             # Load the Windows Magnification API
             self.mag_dll = ctypes.windll.magnification
             
+            # Resolve the function pointers once and declare their prototypes
+            self._mag_init = self.mag_dll.MagInitialize
+            self._mag_init.argtypes = []
+            self._mag_init.restype = ctypes.c_int
+            self._mag_uninit = self.mag_dll.MagUninitialize
+            self._mag_uninit.argtypes = []
+            self._mag_uninit.restype = ctypes.c_int
+            self._mag_set = self.mag_dll.MagSetFullscreenColorEffect
+            self._mag_set.argtypes = [ctypes.POINTER(ColorMatrix)]
+            self._mag_set.restype = ctypes.c_int
+            
             # Initialize the Magnification API
-            if not self.mag_dll.MagInitialize():
-                error_code = ctypes.windll.kernel32.GetLastError()
+            if not self._mag_init():
+                error_code = _GetLastError()
                 self.logger.error(f"Failed to initialize Windows Magnification API. Error code: {error_code}")
                 self.simulation_mode = True
                 return False
@@ -101,19 +256,23 @@ class FilterManager:
             self.simulation_mode = True
             return False
     
-    def set_intensity(self, value):
-        self.intensity = max(0.0, min(1.0, float(value)))
-        self.logger.info(f"Setting filter intensity to {self.intensity}")
-        
+    def set(self, intensity=None, color_temperature=None):
+        """Update intensity and/or color temperature with a single filter update"""
+        if intensity is not None:
+            self.intensity = max(0.0, min(1.0, float(intensity)))
+            self.logger.info("Setting filter intensity to %s", self.intensity)
+        if color_temperature is not None:
+            self.color_temperature = max(1000, min(6500, int(color_temperature)))
+            self._temp_factor = _temperature_factor(self.color_temperature)
+            self.logger.info("Setting color temperature to %sK", self.color_temperature)
         if self.enabled:
             self._apply_filter()
     
+    def set_intensity(self, value):
+        self.set(intensity=value)
+    
     def set_color_temperature(self, value):
-        self.color_temperature = max(1000, min(6500, int(value)))
-        self.logger.info(f"Setting color temperature to {self.color_temperature}K")
-        
-        if self.enabled:
-            self._apply_filter()
+        self.set(color_temperature=value)
     
     def toggle(self):
         """Toggle the filter on/off"""
@@ -128,7 +287,8 @@ class FilterManager:
         self.logger.info("Enabling blue light filter")
         
         # Try to recover from simulation mode if it's been a while
-        self._try_recover_from_simulation()
+        if self.simulation_mode:
+            self._try_recover_from_simulation()
         
         # If we're in simulation mode, show a message to the user
         if self.simulation_mode:
@@ -139,8 +299,6 @@ class FilterManager:
             self.logger.debug(f"Current admin status: {admin_status}")
             
             try:
-                import tkinter.messagebox as messagebox
-                
                 if admin_status:
                     # Already running as admin, different message needed
                     messagebox.showinfo(
@@ -178,7 +336,6 @@ class FilterManager:
             
             # If we failed to apply the filter, show a message to the user
             try:
-                import tkinter.messagebox as messagebox
                 messagebox.showerror(
                     "Filter Error",
                     "Failed to enable the blue light filter.\n\n"
@@ -195,7 +352,8 @@ class FilterManager:
         self.logger.info("Disabling blue light filter")
         
         # Try to recover from simulation mode if it's been a while
-        self._try_recover_from_simulation()
+        if self.simulation_mode:
+            self._try_recover_from_simulation()
         
         result = self._remove_filter()
         # Only set enabled flag if filter was successfully removed
@@ -211,10 +369,21 @@ class FilterManager:
         """Return whether the filter is currently enabled"""
         return self.enabled
     
+    def _log_error(self, key, message, exc_info=False):
+        """
+        Log a filter error at most once per ERROR_LOG_INTERVAL for each key.
+        The logged error keeps its traceback; only the repeats are dropped.
+        """
+        now = time.monotonic()
+        if now - self._last_error_log.get(key, -ERROR_LOG_INTERVAL) < ERROR_LOG_INTERVAL:
+            return
+        self._last_error_log[key] = now
+        self.logger.error(message, exc_info=exc_info)
+    
     def _apply_filter(self):
         """Apply the blue light filter based on current settings"""
         if self.simulation_mode:
-            self.logger.info(f"Filter simulated at intensity: {self.intensity}, temp: {self.color_temperature}K")
+            self.logger.info("Filter simulated at intensity: %s, temp: %sK", self.intensity, self.color_temperature)
             return True
             
         try:
@@ -227,7 +396,7 @@ class FilterManager:
                 if self.simulation_error_count >= 3:
                     self.logger.error(f"Multiple filter application failures ({self.simulation_error_count}), switching to simulation mode")
                     self.simulation_mode = True
-                    self.logger.info(f"Filter simulated at intensity: {self.intensity}, temp: {self.color_temperature}K")
+                    self.logger.info("Filter simulated at intensity: %s, temp: %sK", self.intensity, self.color_temperature)
                     return True
                 
                 # Otherwise just return the failure
@@ -238,9 +407,7 @@ class FilterManager:
             return True
             
         except Exception as e:
-            self.logger.error(f"Error applying filter: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self._log_error("apply", f"Error applying filter: {e}", exc_info=True)
             
             # Increment error count
             self.simulation_error_count += 1
@@ -248,10 +415,10 @@ class FilterManager:
             # If we've had multiple failures, switch to simulation mode
             if self.simulation_error_count >= 3:
                 self.logger.error(f"Multiple filter application failures ({self.simulation_error_count}), switching to simulation mode")
-            self.simulation_mode = True
-            self.logger.info(f"Filter simulated at intensity: {self.intensity}, temp: {self.color_temperature}K")
-            return True
-                
+                self.simulation_mode = True
+                self.logger.info("Filter simulated at intensity: %s, temp: %sK", self.intensity, self.color_temperature)
+                return True
+            
             return False
     
     def _remove_filter(self):
@@ -281,9 +448,7 @@ class FilterManager:
             return True
             
         except Exception as e:
-            self.logger.error(f"Error removing filter: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self._log_error("remove", f"Error removing filter: {e}", exc_info=True)
             
             # Increment error count
             self.simulation_error_count += 1
@@ -291,10 +456,10 @@ class FilterManager:
             # If we've had multiple failures, switch to simulation mode
             if self.simulation_error_count >= 3:
                 self.logger.error(f"Multiple filter removal failures ({self.simulation_error_count}), switching to simulation mode")
-            self.simulation_mode = True
-            self.logger.info("Filter removed (simulation)")
-            return True
-                
+                self.simulation_mode = True
+                self.logger.info("Filter removed (simulation)")
+                return True
+            
             return False
     
     def _apply_windows_filter(self):
@@ -302,7 +467,7 @@ class FilterManager:
         try:
             # If we're already in simulation mode, don't attempt to use the Windows API
             if self.simulation_mode:
-                self.logger.info(f"Filter simulated at intensity: {self.intensity}, temp: {self.color_temperature}K")
+                self.logger.info("Filter simulated at intensity: %s, temp: %sK", self.intensity, self.color_temperature)
                 return True
                 
             if not self.mag_dll:
@@ -313,14 +478,14 @@ class FilterManager:
                     return False
             
             # Make sure the API is initialized
-            if not hasattr(self, 'api_initialized') or not self.api_initialized:
+            if not self.api_initialized:
                 try:
-                    result = self.mag_dll.MagInitialize()
+                    result = self._mag_init()
                     if result:
                         self.logger.info("Magnification API initialized")
                         self.api_initialized = True
                     else:
-                        error_code = ctypes.windll.kernel32.GetLastError()
+                        error_code = _GetLastError()
                         admin_status = is_admin()
                         self.logger.error(f"Failed to initialize magnification API. Error code: {error_code}, Admin: {admin_status}")
                         return False
@@ -329,156 +494,117 @@ class FilterManager:
                     self.logger.error(f"Error initializing magnification API: {e}, Admin: {admin_status}")
                     return False
                 
-            class ColorMatrix(ctypes.Structure):
-                _fields_ = [
-                    ("matrix", ctypes.c_float * 25)
-                ]
-            
-            # Create matrix based on intensity and color temperature
-            matrix = self._create_color_matrix()
-            
-            # Define the transform structure
-            colorEffect = ColorMatrix()
-            colorEffect.matrix = matrix
-            
-            # Apply the color transform
-            result = self.mag_dll.MagSetFullscreenColorEffect(ctypes.byref(colorEffect))
-            
-            if result == 0:
-                error_code = ctypes.windll.kernel32.GetLastError()
-                self.logger.error(f"Failed to apply color filter. Error code: {error_code}")
-                
-                # Special handling for error code 21 (ACCESS_DENIED)
-                if error_code == 21:
-                    admin_status = is_admin()
-                    if admin_status:
-                        self.logger.warning("Access denied when applying filter even though running as administrator. This may be a Windows security feature or compatibility issue.")
+            # Create the transform structure based on intensity and color temperature
+            effect = self._create_color_matrix()
+            error_code = None
+            
+            # Apply the color transform; on a known error run its recovery step and retry once
+            for attempt in range(2):
+                if self._mag_set(effect):
+                    if attempt:
+                        self.logger.info("Successfully applied filter after recovery")
                     else:
-                        self.logger.warning("Access denied when applying filter. This requires administrator privileges.")
-                    
-                    self.logger.info(f"Attempting alternative method for applying filter (Admin status: {admin_status})...")
-                    
-                    # Try an alternative approach - use a different API call
-                    try:
-                        # First try to uninitialize and reinitialize
-                        self.mag_dll.MagUninitialize()
-                        time.sleep(0.5)
-                        
-                        if self.mag_dll.MagInitialize():
-                            # Try with a different approach - set a smaller transform
-                            # This sometimes works when the full screen transform fails
-                            self.logger.info("Trying with a different approach...")
-                            
-                            # Create a smaller matrix with less blue reduction
-                            reduced_intensity = self.intensity * 0.5
-                            self.logger.info(f"Using reduced intensity: {reduced_intensity}")
-                            
-                            # Create a new matrix with reduced intensity
-                            alt_matrix = self._create_color_matrix(override_intensity=reduced_intensity)
-                            alt_effect = ColorMatrix()
-                            alt_effect.matrix = alt_matrix
-                            
-                            # Try applying the reduced effect
-                            result = self.mag_dll.MagSetFullscreenColorEffect(ctypes.byref(alt_effect))
-                            if result != 0:
-                                self.logger.info("Successfully applied filter with reduced intensity")
-                                return True
-                    except Exception as e:
-                        self.logger.error(f"Error in alternative filter application: {e}")
-                    
-                    # If we get here, all attempts failed
-                    self.logger.error("All attempts to apply filter failed. You may need to run as administrator.")
-                    
-                    # Show a message to the user about the error
-                    try:
-                        import tkinter.messagebox as messagebox
-                        messagebox.showwarning(
-                            "Permission Error",
-                            "The blue light filter could not be applied due to permission issues.\n\n"
-                            "You may need to run this application as administrator."
-                        )
-                    except Exception:
-                        pass  # Ignore errors showing the message
+                        self.logger.info("Windows color filter applied successfully")
+                    return True
                 
-                # Try to reinitialize and try again for certain error codes
-                elif error_code in [5, 6, 50, 1812]:  # Common error codes for access issues
-                    self.logger.info("Trying to reinitialize magnification API")
-                    
-                    # First uninitialize
-                    try:
-                        self.mag_dll.MagUninitialize()
-                    except Exception as e:
-                        self.logger.error(f"Error uninitializing magnification API: {e}")
-                    
-                    # Wait a moment
-                    time.sleep(0.5)
-                    
-                    # Try to initialize again
-                    try:
-                        if self.mag_dll.MagInitialize():
-                            self.logger.info("Reinitialized magnification API, trying to apply filter again")
-                            
-                            # Try to apply the filter again
-                            try:
-                                result = self.mag_dll.MagSetFullscreenColorEffect(ctypes.byref(colorEffect))
-                                if result != 0:
-                                    self.logger.info("Successfully applied filter after reinitialization")
-                                    return True
-                                else:
-                                    self.logger.error("Failed to apply filter after reinitialization")
-                            except Exception as e:
-                                self.logger.error(f"Error applying filter after reinitialization: {e}")
-                        else:
-                            self.logger.error("Failed to reinitialize magnification API")
-                    except Exception as e:
-                        self.logger.error(f"Error reinitializing magnification API: {e}")
+                if error_code is not None:
+                    self.logger.error("Failed to apply filter after recovery")
+                    break
                 
-                return False
+                error_code = _GetLastError()
+                self._log_error(("apply", error_code), f"Failed to apply color filter. Error code: {error_code}")
+                
+                handler = self._APPLY_ERROR_HANDLERS.get(error_code)
+                effect = handler(self, effect) if handler else None
+                if effect is None:
+                    break
+            
+            if error_code == ERROR_ACCESS_DENIED:
+                # If we get here, all attempts failed
+                self.logger.error("All attempts to apply filter failed. You may need to run as administrator.")
+                
+                # Show a message to the user about the error
+                try:
+                    messagebox.showwarning(
+                        "Permission Error",
+                        "The blue light filter could not be applied due to permission issues.\n\n"
+                        "You may need to run this application as administrator."
+                    )
+                except Exception:
+                    pass  # Ignore errors showing the message
             
-            self.logger.info("Windows color filter applied successfully")
-            return True
+            return False
             
         except Exception as e:
-            self.logger.error(f"Exception in _apply_windows_filter: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self._log_error("apply_windows", f"Exception in _apply_windows_filter: {e}", exc_info=True)
             return False
     
-    def _create_color_matrix(self, override_intensity=None):
-        """Create a color matrix for the blue light filter based on intensity and color temperature"""
-        # Use the override intensity if provided, otherwise use the instance intensity
-        intensity = override_intensity if override_intensity is not None else self.intensity
-        
-        # Create a flattened 5x5 matrix (25 elements)
-        matrix = (ctypes.c_float * 25)(
-            1.0, 0.0, 0.0, 0.0, 0.0,  # Row 1
-            0.0, 1.0, 0.0, 0.0, 0.0,  # Row 2
-            0.0, 0.0, 1.0, 0.0, 0.0,  # Row 3
-            0.0, 0.0, 0.0, 1.0, 0.0,  # Row 4
-            0.0, 0.0, 0.0, 0.0, 1.0   # Row 5
-        )
-        
-        # Calculate factors based on intensity and color temperature
-        temp_factor = (6500 - self.color_temperature) / 5500  # Normalize temp to 0-1 range
-        temp_factor = max(0, min(1, temp_factor))
-        
-        # Reduce blue based on intensity and temperature
-        blue_reduction = intensity * temp_factor
+    def _reinitialize_magnification(self):
+        """Uninitialize and reinitialize the magnification API, returning whether it worked"""
+        try:
+            self._mag_uninit()
+        except Exception as e:
+            self.logger.error(f"Error uninitializing magnification API: {e}")
         
-        # Adjust red slightly higher for warmer appearance
-        red_boost = intensity * temp_factor * 0.3
+        # Wait a moment
+        time.sleep(0.5)
         
-        # Modify the color matrix
-        # Red channel (slightly increased for warmer appearance)
-        matrix[0] = 1.0 + red_boost
+        try:
+            if self._mag_init():
+                return True
+            self.logger.error("Failed to reinitialize magnification API")
+        except Exception as e:
+            self.logger.error(f"Error reinitializing magnification API: {e}")
+        return False
+    
+    def _handle_access_denied(self, effect):
+        """Recovery for ERROR_ACCESS_DENIED: reinitialize and retry with reduced intensity"""
+        admin_status = is_admin()
+        if admin_status:
+            self.logger.warning("Access denied when applying filter even though running as administrator. This may be a Windows security feature or compatibility issue.")
+        else:
+            self.logger.warning("Access denied when applying filter. This requires administrator privileges.")
         
-        # Green channel (slightly reduced)
-        matrix[6] = 1.0 - (intensity * 0.1)
+        self.logger.info(f"Attempting alternative method for applying filter (Admin status: {admin_status})...")
+        if not self._reinitialize_magnification():
+            return None
         
-        # Blue channel (reduced based on settings)
-        matrix[12] = 1.0 - blue_reduction
+        # Try with a different approach - set a smaller transform
+        # This sometimes works when the full screen transform fails
+        self.logger.info("Trying with a different approach...")
+        reduced_intensity = self.intensity * 0.5
+        self.logger.info(f"Using reduced intensity: {reduced_intensity}")
+        return self._create_color_matrix(override_intensity=reduced_intensity)
+    
+    def _handle_reinitialize(self, effect):
+        """Recovery for transient access errors: reinitialize and retry the same effect"""
+        self.logger.info("Trying to reinitialize magnification API")
+        if not self._reinitialize_magnification():
+            return None
         
-        return matrix
+        self.logger.info("Reinitialized magnification API, trying to apply filter again")
+        return effect
+    
+    # Error code -> recovery step; each returns the effect to retry with, or None to give up
+    _APPLY_ERROR_HANDLERS = dict.fromkeys(REINIT_ERROR_CODES, _handle_reinitialize)
+    _APPLY_ERROR_HANDLERS[ERROR_ACCESS_DENIED] = _handle_access_denied
+    
+    def _compute_scales(self, override_intensity=None):
+        """Compute the (red, green, blue) scales for the current intensity and color temperature"""
+        # Use the override intensity if provided, otherwise use the instance intensity
+        intensity = override_intensity if override_intensity is not None else self.intensity
+        return _channel_scales(intensity, self._temp_factor)
+    
+    def _create_color_matrix(self, override_intensity=None):
+        """Update the shared color effect for the blue light filter and return it"""
+        scales = self._compute_scales(override_intensity)
+        
+        # Identical settings (e.g. repeated slider values) leave the struct untouched
+        if scales != self._effect_scales:
+            matrix = self._effect.matrix
+            matrix[0], matrix[6], matrix[12] = scales
+            self._effect_scales = scales
+        return self._effect
     
     def _remove_windows_filter(self):
         """Remove the Windows color filter"""
@@ -489,68 +615,36 @@ class FilterManager:
             
         try:
             # Make sure the API is initialized
-            if not hasattr(self, 'api_initialized') or not self.api_initialized:
+            if not self.api_initialized:
                 try:
-                    result = self.mag_dll.MagInitialize()
+                    result = self._mag_init()
                     if result:
                         self.logger.info("Magnification API initialized")
                         self.api_initialized = True
                     else:
-                        error_code = ctypes.windll.kernel32.GetLastError()
+                        error_code = _GetLastError()
                         self.logger.error(f"Failed to initialize magnification API. Error code: {error_code}")
                         return False
                 except Exception as e:
                     self.logger.error(f"Error initializing magnification API: {e}")
                     return False
             
-            # Create an identity matrix (no change) using the same approach as _create_color_matrix
-            matrix = (ctypes.c_float * 25)(
-                1.0, 0.0, 0.0, 0.0, 0.0,  # Row 1
-                0.0, 1.0, 0.0, 0.0, 0.0,  # Row 2
-                0.0, 0.0, 1.0, 0.0, 0.0,  # Row 3
-                0.0, 0.0, 0.0, 1.0, 0.0,  # Row 4
-                0.0, 0.0, 0.0, 0.0, 1.0   # Row 5
-            )
-            
-            # Apply the identity matrix to remove the filter
-            result = self.mag_dll.MagSetFullscreenColorEffect(ctypes.byref(matrix))
+            # Apply the shared identity effect to remove the filter
+            result = self._mag_set(_IDENTITY_EFFECT)
             
             if result == 0:
-                error_code = ctypes.windll.kernel32.GetLastError()
-                self.logger.error(f"Failed to remove Windows color filter. Error code: {error_code}")
+                error_code = _GetLastError()
+                self._log_error(("remove", error_code), f"Failed to remove Windows color filter. Error code: {error_code}")
                 
                 # Try to reinitialize and try again for certain error codes
-                if error_code in [5, 6, 50, 1812]:  # Common error codes for access issues
+                if error_code in REINIT_ERROR_CODES:
                     self.logger.info("Trying to reinitialize magnification API")
-                    
-                    # First uninitialize
-                    try:
-                        self.mag_dll.MagUninitialize()
-                    except Exception as e:
-                        self.logger.error(f"Error uninitializing magnification API: {e}")
-                    
-                    # Wait a moment
-                    time.sleep(0.5)
-                    
-                    # Try to initialize again
-                    try:
-                        if self.mag_dll.MagInitialize():
-                            self.logger.info("Reinitialized magnification API, trying to remove filter again")
-                            
-                            # Try to remove the filter again
-                            try:
-                                result = self.mag_dll.MagSetFullscreenColorEffect(ctypes.byref(matrix))
-                                if result != 0:
-                                    self.logger.info("Successfully removed filter after reinitialization")
-                                    return True
-                                else:
-                                    self.logger.error("Failed to remove filter after reinitialization")
-                            except Exception as e:
-                                self.logger.error(f"Error removing filter after reinitialization: {e}")
-                        else:
-                            self.logger.error("Failed to reinitialize magnification API")
-                    except Exception as e:
-                        self.logger.error(f"Error reinitializing magnification API: {e}")
+                    if self._reinitialize_magnification():
+                        self.logger.info("Reinitialized magnification API, trying to remove filter again")
+                        if self._mag_set(_IDENTITY_EFFECT):
+                            self.logger.info("Successfully removed filter after reinitialization")
+                            return True
+                        self.logger.error("Failed to remove filter after reinitialization")
                 
                 return False
             
@@ -558,9 +652,7 @@ class FilterManager:
             return True
             
         except Exception as e:
-            self.logger.error(f"Error removing Windows color filter: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self._log_error("remove_windows", f"Error removing Windows color filter: {e}", exc_info=True)
             return False
     
     def cleanup(self):
@@ -572,7 +664,7 @@ class FilterManager:
         # Then uninitialize magnification API if needed
         if sys.platform == "win32" and self.mag_dll:
             try:
-                self.mag_dll.MagUninitialize()
+                self._mag_uninit()
                 self.logger.info("Windows Magnification API uninitialized")
             except Exception as e:
                 self.logger.error(f"Error uninitializing Windows Magnification API: {e}")
@@ -586,8 +678,8 @@ class FilterManager:
             return False
             
         # Don't attempt recovery too frequently - only try once every 5 minutes
-        current_time = time.time()
-        if current_time - self.last_real_attempt_time < 300:  # 5 minutes
+        current_time = time.monotonic()
+        if current_time - self.last_real_attempt_time < SIMULATION_RECOVERY_INTERVAL:
             return False
             
         self.logger.info("Attempting to recover from simulation mode...")
@@ -607,11 +699,27 @@ class FilterManager:
 
 
 class ConfigManager:
+    __slots__ = (
+        "logger", "config_dir", "config_file", "_lock", "_dirty", "_save_timer",
+        "_batch_depth", "_batch_pending", "config",
+    )
+    
+    # Seconds of inactivity after the last set() before changes are written
+    SAVE_DELAY = 0.5
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.config_dir = Path.home() / ".openbluefilter"
         self.config_file = self.config_dir / "config.json"
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._save_timer = None
+        self._batch_depth = 0
+        self._batch_pending = False
         self.config = self._load_config()
+        
+        # Write any changes still waiting on the timer when the app exits
+        atexit.register(self.flush)
     
     def _load_config(self):
         default_config = {
@@ -638,35 +746,42 @@ class ConfigManager:
             "active_profile": "Day"
         }
         
-        os.makedirs(self.config_dir, exist_ok=True)
-        
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                
-                # Ensure all default keys exist in loaded config
-                for key, value in default_config.items():
-                    if key not in config:
-                        config[key] = value
-                
-                self.logger.info("Configuration loaded successfully")
-                return config
-            except Exception as e:
-                self.logger.error(f"Error loading config: {e}")
-                return default_config
-        else:
+        try:
+            with open(self.config_file, 'rb') as f:
+                config = _load_json(f.read())
+        except FileNotFoundError:
             self.logger.info("Config file not found, creating default configuration")
+            # Only a missing file can mean a missing directory
+            self.config_dir.mkdir(parents=True, exist_ok=True)
             self._save_config(default_config)
             return default_config
+        except Exception as e:
+            self.logger.error(f"Error loading config: {e}")
+            return default_config
+        
+        if not isinstance(config, dict):
+            self.logger.error("Error loading config: top-level value is not an object")
+            return default_config
+        
+        # Ensure all default keys exist in loaded config
+        for key, value in default_config.items():
+            if key not in config:
+                config[key] = value
+        
+        self.logger.info("Configuration loaded successfully")
+        return config
     
     def _save_config(self, config=None):
         if config is None:
             config = self.config
             
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            # Write a sibling file and swap it in, so a crash mid-write never
+            # leaves a truncated config behind
+            tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(_dump_json(config))
+            os.replace(tmp_file, self.config_file)
             self.logger.info("Configuration saved successfully")
             return True
         except Exception as e:
@@ -674,152 +789,226 @@ class ConfigManager:
             return False
     
     def get(self, key, default=None):
-        try:
-            value = self.config.get(key, default)
-            return value
-        except:
-            return default
+        return self.config.get(key, default)
     
     def set(self, key, value):
-        self.config[key] = value
-        self._save_config()
+        with self._lock:
+            # Re-setting the current value leaves nothing to write; containers
+            # may have been edited in place, so those are always written
+            if (not isinstance(value, (dict, list)) and key in self.config
+                    and self.config[key] == value):
+                return
+            self.config[key] = value
+            self._dirty = True
+        
+        # Inside a batch the write happens once, when the outermost block exits
+        if self._batch_depth:
+            self._batch_pending = True
+        else:
+            self._schedule_save()
+    
+    def save_config(self):
+        """Write the configuration to disk now, replacing any pending delayed save"""
+        # Inside a batch the write happens once, when the outermost block exits
+        if self._batch_depth:
+            self._batch_pending = True
+            return True
+        
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        with self._lock:
+            return self._write_locked()
+    
+    @contextmanager
+    def batch(self):
+        """Coalesce all set() and save_config() calls made inside the block into a single write"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_pending:
+                self._batch_pending = False
+                self.save_config()
+    
+    def _schedule_save(self):
+        """Restart the save timer so a burst of set() calls produces a single write"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
+    def flush(self):
+        """Write the configuration if it has unsaved changes"""
+        with self._lock:
+            if not self._dirty:
+                return True
+            return self._write_locked()
+    
+    def _write_locked(self):
+        """Save the config; the caller holds the lock. A failed write stays dirty to be retried"""
+        if not self._save_config():
+            return False
+        self._dirty = False
+        return True
 
 
 class ProfileManager:
+    __slots__ = (
+        "logger", "config_manager", "filter_manager", "_profiles", "_active",
+        "_profile_names", "_profile_index", "_last_applied",
+    )
+    
     def __init__(self, config_manager, filter_manager):
         self.logger = logging.getLogger(__name__)
         self.config_manager = config_manager
         self.filter_manager = filter_manager
         
+        # Read the profiles once; this is the same dict the config holds, so edits are made in place
+        self._profiles = self.config_manager.get("profiles", {})
+        self._active = self.config_manager.get("active_profile")
+        self._last_applied = None  # Profile and filter settings from the last activation
+        
         # Create default profiles if none exist
         self.create_default_profiles()
     
     def get_all_profiles(self):
-        """Get a list of all available profiles"""
-        return self.config_manager.get("profiles", {}).keys()
+        """Get a tuple of all available profile names in display order"""
+        return self._profile_names
+    
+    def get_first_profile_name(self):
+        """Get the first profile name in display order, or None if there are no profiles"""
+        names = self._profile_names
+        return names[0] if names else None
+    
+    def has_profile(self, profile_name):
+        """Check whether a profile exists without scanning the name tuple"""
+        return profile_name in self._profile_index
+    
+    def get_profile_index(self, profile_name):
+        """Get the display position of a profile, or None if it does not exist"""
+        return self._profile_index.get(profile_name)
+    
+    def _invalidate_names(self):
+        """Rebuild the cached profile names after profiles are added or removed"""
+        # Built-in profiles first in their usual order, then any others alphabetically
+        profiles = self._profiles
+        names = [name for name in PROFILE_ORDER if name in profiles]
+        names.extend(sorted(profiles.keys() - _PROFILE_ORDER_SET))
+        self._profile_names = tuple(names)
+        self._profile_index = {name: i for i, name in enumerate(self._profile_names)}
     
     def get_active_profile_name(self):
         """Get the name of the currently active profile"""
-        return self.config_manager.get("active_profile", None)
+        return self._active
+    
+    def _set_active_profile(self, profile_name):
+        """Record the active profile name in the cache and the config"""
+        self._active = profile_name
+        self.config_manager.set("active_profile", profile_name)
+    
+    def _profiles_changed(self):
+        """Mark the cached profiles dict as modified in the config"""
+        self.config_manager.set("profiles", self._profiles)
         
     def activate_profile(self, profile_name):
         """Activate a profile by name"""
         try:
-            profiles = self.config_manager.get("profiles", {})
-            
-            if profile_name not in profiles:
-                self.logger.warning(f"Profile {profile_name} does not exist")
-                return False
+            with self.config_manager.batch():
+                # Get profile settings
+                profile = self._profiles.get(profile_name)
+                if profile is None:
+                    self.logger.warning(f"Profile {profile_name} does not exist")
+                    return False
                 
-            # Get profile settings
-            profile = profiles[profile_name]
-            intensity = profile.get("intensity", 50)
-            color_temperature = profile.get("color_temperature", 4500)
-            
-            self.logger.info(f"Activating profile {profile_name} (intensity={intensity}%, temp={color_temperature}K)")
-            
-            # Apply settings
-            self.filter_manager.set_intensity(intensity)
-            self.filter_manager.set_color_temperature(color_temperature)
-            
-            # Save active profile name
-            self.config_manager.set("active_profile", profile_name)
-            self.config_manager.save_config()
-            
-            return True
+                intensity = profile.get("intensity", 50)
+                color_temperature = profile.get("color_temperature", 4500)
+                
+                # Nothing to do if this profile is still active and the filter still has its settings
+                filter_manager = self.filter_manager
+                if profile_name == self._active and self._last_applied == (
+                    profile_name, intensity, color_temperature,
+                    filter_manager.intensity, filter_manager.color_temperature,
+                ):
+                    return True
+                
+                self.logger.info("Activating profile %s (intensity=%s%%, temp=%sK)", profile_name, intensity, color_temperature)
+                
+                # Apply settings
+                filter_manager.set(intensity, color_temperature)
+                
+                # Save active profile name
+                self._set_active_profile(profile_name)
+                self.config_manager.save_config()
+                self._last_applied = (
+                    profile_name, intensity, color_temperature,
+                    filter_manager.intensity, filter_manager.color_temperature,
+                )
+                
+                return True
         except Exception as e:
             self.logger.error(f"Error activating profile: {e}")
             return False
             
     def create_default_profiles(self):
         """Create default profiles if they don't exist"""
-        profiles = self.config_manager.get("profiles", {})
-        
-        # Create default profiles if config is empty
-        if not profiles:
-            self.logger.info("Creating default profiles")
-            profiles = {
-                "Morning": {
-                    "intensity": 30,
-                    "color_temperature": 5000
-                },
-                "Evening": {
-                    "intensity": 50,
-                    "color_temperature": 4000
-                },
-                "Night": {
-                    "intensity": 70,
-                    "color_temperature": 2500
-                }
-            }
-            self.config_manager.set("profiles", profiles)
-            
-            # Set default active profile
-            if not self.config_manager.get("active_profile"):
-                # Determine which profile to set based on time of day
-                hour = datetime.now().hour
+        # Every change below is written to disk once, when the batch exits
+        with self.config_manager.batch():
+            profiles = self._profiles
+            
+            # Create default profiles if config is empty
+            if not profiles:
+                self.logger.info("Creating default profiles")
+                profiles = {name: dict(settings) for name, settings in DEFAULT_PROFILES.items()}
+                self._profiles = profiles
+                self._profiles_changed()
                 
-                if 6 <= hour < 12:
-                    default_profile = "Morning"
-                elif 12 <= hour < 19:
-                    default_profile = "Evening"
-                else:
-                    default_profile = "Night"
-                    
-                self.config_manager.set("active_profile", default_profile)
-            
-            self.config_manager.save_config()
-        else:
-            # Check if we need to update default profiles with new fields
-            default_profiles = {
-                "Morning": {
-                    "intensity": 30,
-                    "color_temperature": 5000
-                },
-                "Evening": {
-                    "intensity": 50,
-                    "color_temperature": 4000
-                },
-                "Night": {
-                    "intensity": 70,
-                    "color_temperature": 2500
-                }
-            }
-            
-            # Update any missing default profiles
-            updated = False
-            for name, settings in default_profiles.items():
-                if name not in profiles:
-                    profiles[name] = settings
-                    updated = True
-                    self.logger.info(f"Added missing default profile: {name}")
+                # Set default active profile
+                if not self._active:
+                    # Determine which profile to set based on time of day
+                    default_profile = HOUR_TO_PROFILE[datetime.now().hour]
+                    self._set_active_profile(default_profile)
+            else:
+                # Update any missing default profiles
+                updated = False
+                for name, settings in DEFAULT_PROFILES.items():
+                    if name not in profiles:
+                        profiles[name] = dict(settings)
+                        updated = True
+                        self.logger.info(f"Added missing default profile: {name}")
+                
+                if updated:
+                    self._profiles_changed()
             
-            if updated:
-                self.config_manager.set("profiles", profiles)
-                self.config_manager.save_config()
+            self._invalidate_names()
     
     def save_profile(self, profile_name, intensity=None, color_temperature=None):
         """Save a new or existing profile"""
         try:
-            profiles = self.config_manager.get("profiles", {})
-            
-            # If the profile doesn't exist, create it
-            if profile_name not in profiles:
-                profiles[profile_name] = {}
-            
-            # Update profile settings
-            if intensity is not None:
-                profiles[profile_name]["intensity"] = intensity
+            with self.config_manager.batch():
+                profiles = self._profiles
                 
-            if color_temperature is not None:
-                profiles[profile_name]["color_temperature"] = color_temperature
-            
-            # Save profiles to config
-            self.config_manager.set("profiles", profiles)
-            self.config_manager.save_config()
-            
-            self.logger.info(f"Saved profile {profile_name}")
-            return True
+                # Get the profile, creating it if it doesn't exist
+                is_new = profile_name not in profiles
+                profile = profiles.setdefault(profile_name, {})
+                
+                # Update profile settings
+                if intensity is not None:
+                    profile["intensity"] = intensity
+                    
+                if color_temperature is not None:
+                    profile["color_temperature"] = color_temperature
+                
+                # Save profiles to config; the cached names only change when a profile is added
+                self._profiles_changed()
+                if is_new:
+                    self._invalidate_names()
+                self.config_manager.save_config()
+                
+                self.logger.info(f"Saved profile {profile_name}")
+                return True
         except Exception as e:
             self.logger.error(f"Error saving profile: {e}")
             return False
@@ -827,26 +1016,28 @@ class ProfileManager:
     def delete_profile(self, profile_name):
         """Delete a profile by name"""
         try:
-            profiles = self.config_manager.get("profiles", {})
-            
-            if profile_name not in profiles:
-                self.logger.warning(f"Cannot delete profile {profile_name} - does not exist")
-                return False
-            
-            # Delete the profile
-            del profiles[profile_name]
-            
-            # Update config
-            self.config_manager.set("profiles", profiles)
-            
-            # If the deleted profile was active, clear the active profile
-            if self.config_manager.get("active_profile") == profile_name:
-                self.config_manager.set("active_profile", None)
-            
-            self.config_manager.save_config()
-            
-            self.logger.info(f"Deleted profile {profile_name}")
-            return True
+            with self.config_manager.batch():
+                profiles = self._profiles
+                
+                if profile_name not in profiles:
+                    self.logger.warning(f"Cannot delete profile {profile_name} - does not exist")
+                    return False
+                
+                # Delete the profile
+                del profiles[profile_name]
+                
+                # Update config
+                self._profiles_changed()
+                self._invalidate_names()
+                
+                # If the deleted profile was active, clear the active profile
+                if self._active == profile_name:
+                    self._set_active_profile(None)
+                
+                self.config_manager.save_config()
+                
+                self.logger.info(f"Deleted profile {profile_name}")
+                return True
         except Exception as e:
             self.logger.error(f"Error deleting profile: {e}")
             return False
@@ -859,6 +1050,33 @@ class SystemTrayApp:
         
         # Initialize components
         self._load_icons()
+        self._init_fonts()
+        
+        # Header icons for each filter state, resolved once for _update_filter_ui
+        self._icon_on = self.icons.get('app_enabled')
+        self._icon_off = self.icons.get('app')
+        
+        # Throttle windows for slider changes, keyed by filter setting: the
+        # after() id of each open window and the settings changed while open
+        self._slider_after_ids = {}
+        self._slider_pending = set()
+        
+        # Profile names currently shown in the profiles listbox
+        self._last_listbox_names = None
+        
+        # Filter state the toggle button and status bar currently show
+        self._last_filter_ui_state = None
+        
+        # Schedule warning label, created on first use and then only re-texted and shown/hidden
+        self._schedule_warning_var = None
+        self._schedule_warning_label = None
+        
+        # Schedule form values as of the last successful save
+        self._last_saved_schedule = None
+        
+        # Schedule mode currently shown and profile names loaded into the schedule dropdowns
+        self._last_schedule_mode = None
+        self._last_combo_profiles = None
         
         # Create filter manager
         self.filter_manager = FilterManager()
@@ -872,6 +1090,7 @@ class SystemTrayApp:
         
         # Set up the main window
         self._setup_ui()
+        self._icon_label = getattr(self, 'app_icon_label', None)
         
         # Apply initial settings from config
         self._apply_initial_settings()
@@ -879,9 +1098,9 @@ class SystemTrayApp:
     def _load_icons(self):
         """Load icon images for the application"""
         try:
-            # Get the absolute path to resources directory
-            resources_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources')
-            
+            # PIL is only needed here, so keep it off the startup path
+            from PIL import Image, ImageTk
+
             # List of icons to load
             icon_files = {
                 'app': 'icon.png',
@@ -891,26 +1110,28 @@ class SystemTrayApp:
             }
             
             self.icons = {}
+            present = _resource_files()
             for key, filename in icon_files.items():
-                path = os.path.join(resources_dir, filename)
-                if os.path.exists(path):
+                path = present.get(filename)
+                if path:
                     self.icons[key] = ImageTk.PhotoImage(Image.open(path))
                     self.logger.info(f"Loaded icon: {path}")
                 else:
-                    self.logger.warning(f"Icon file not found: {path}")
+                    self.logger.warning(f"Icon file not found: {os.path.join(RESOURCES_DIR, filename)}")
             
             # If no icons were loaded successfully, try to generate them
-            if not self.icons and os.path.exists(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'generate_logo.py')):
+            if not self.icons and os.path.exists(GENERATE_LOGO_PATH):
                 self.logger.info("Attempting to generate logo files...")
                 try:
-                    import subprocess
-                    script_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'generate_logo.py')
-                    subprocess.run(['python', script_path], check=True)
+                    # Run the generator in this interpreter instead of spawning a new one
+                    import runpy
+                    runpy.run_path(GENERATE_LOGO_PATH, run_name="__main__")
                     
                     # Try loading again
+                    present = _resource_files()
                     for key, filename in icon_files.items():
-                        path = os.path.join(resources_dir, filename)
-                        if os.path.exists(path):
+                        path = present.get(filename)
+                        if path:
                             self.icons[key] = ImageTk.PhotoImage(Image.open(path))
                             self.logger.info(f"Loaded newly generated icon: {path}")
                 except Exception as e:
@@ -918,60 +1139,71 @@ class SystemTrayApp:
         except Exception as e:
             self.logger.error(f"Error loading icons: {e}")
     
+    def _init_fonts(self):
+        """Create the named fonts used across the UI once, so widgets share them"""
+        self.fonts = {
+            "title": font.Font(family=font.nametofont("TkDefaultFont").cget("family"), size=16, weight="bold"),
+            "h1": font.Font(size=16, weight="bold"),
+            "header": font.Font(size=14, weight="bold"),
+            "bold12": font.Font(size=12, weight="bold"),
+            "bold11": font.Font(size=11, weight="bold"),
+            "bold10": font.Font(size=10, weight="bold"),
+            "normal11": font.Font(size=11),
+            "normal10": font.Font(size=10),
+            "link": font.Font(size=10, underline=True),
+        }
+    
     def _apply_initial_settings(self):
         """Apply initial settings from configuration"""
         # Update profiles in UI
         self._update_profiles()
         
-        # Set initial intensity
+        # Read all the initial settings up front
         intensity = self.config_manager.get("filter.intensity", 0.5)
-        self.intensity_var.set(intensity)
-        self.filter_manager.set_intensity(intensity)
-        self.logger.info(f"Setting filter intensity to {intensity}")
-        
-        # Set initial color temperature
         color_temp = self.config_manager.get("filter.color_temperature", 3200)
+        filter_enabled = self.config_manager.get("filter.enabled", False)
+        active_profile = self.config_manager.get("active_profile", "")
+        profile_index = self.profile_manager.get_profile_index(active_profile)
+        
+        self.intensity_var.set(intensity)
         self.temp_var.set(color_temp)
-        self.filter_manager.set_color_temperature(color_temp)
-        self.logger.info(f"Setting color temperature to {color_temp}K")
+        
+        if profile_index is not None:
+            # The active profile sets intensity and temperature itself; load it before
+            # the filter is enabled so the settings are only pushed to the display once
+            self.profile_manager.activate_profile(active_profile)
+        else:
+            self.filter_manager.set(intensity, color_temp)
         
         # Set filter state
-        filter_enabled = self.config_manager.get("filter.enabled", False)
         if filter_enabled:
             self.filter_manager.enable_filter()
-            self.toggle_button.config(text="Disable Filter")
-            self.status_var.set("Filter: Enabled")
         else:
             self.filter_manager.disable_filter()
-            self.toggle_button.config(text="Enable Filter")
-            self.status_var.set("Filter: Disabled")
+        self._update_filter_ui()
         
-        # Set active profile
-        active_profile = self.config_manager.get("active_profile", "")
-        profiles = list(self.profile_manager.get_all_profiles())
+        # Set the current profile name for display, if the Profiles tab is built yet
+        self._select_active_profile()
+    
+    def _select_active_profile(self):
+        """Select the active profile in the listbox and show its name, defaulting to the first profile"""
+        if not hasattr(self, 'profiles_listbox') or self.profiles_listbox.size() == 0:
+            return
         
-        # Set the current profile name for display
-        if active_profile and active_profile in profiles:
-            # Find the index of the active profile in the listbox
-            if hasattr(self, 'profiles_listbox') and self.profiles_listbox.size() > 0:
-                try:
-                    profile_index = profiles.index(active_profile)
-                    self.profiles_listbox.selection_clear(0, tk.END)
-                    self.profiles_listbox.selection_set(profile_index)
-                    self.profiles_listbox.see(profile_index)
-                    self.current_profile_name.set(active_profile)
-                except (ValueError, tk.TclError) as e:
-                    self.logger.error(f"Error selecting profile in listbox: {e}")
-        elif profiles:
+        active_profile = self.config_manager.get("active_profile", "")
+        profile_index = self.profile_manager.get_profile_index(active_profile)
+        if profile_index is None:
             # Default to first profile if active one not found
-            if hasattr(self, 'profiles_listbox') and self.profiles_listbox.size() > 0:
-                self.profiles_listbox.selection_clear(0, tk.END)
-                self.profiles_listbox.selection_set(0)
-                self.current_profile_name.set(profiles[0])
-                
-        # Load the selected profile settings
-        if active_profile:
-            self.profile_manager.activate_profile(active_profile)
+            profile_index = 0
+            active_profile = self.profile_manager.get_all_profiles()[0]
+        
+        try:
+            self.profiles_listbox.selection_clear(0, tk.END)
+            self.profiles_listbox.selection_set(profile_index)
+            self.profiles_listbox.see(profile_index)
+            self.current_profile_name.set(active_profile)
+        except tk.TclError as e:
+            self.logger.error(f"Error selecting profile in listbox: {e}")
     
     def _setup_ui(self):
         # Configure main window
@@ -981,23 +1213,27 @@ class SystemTrayApp:
         main_frame = ttk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Configure styles
+        # Configure styles through one shared Style object
+        self._style = ttk.Style(self.root)
         self._configure_styles()
         
         # Create header with icon and title
         self._create_header(main_frame)
         
         # Create notebook for tabs
-        style = ttk.Style()
-        style.configure("TNotebook", tabposition='n')
+        self._style.configure("TNotebook", tabposition='n')
         
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
         
-        # Add tabs
+        # Add tabs; Profiles and About are only built the first time they are selected
         self._setup_settings_tab()
-        self._setup_profiles_tab()
-        self._setup_about_tab()
+        self._lazy_tabs = {}
+        for text, builder in (("Profiles", self._setup_profiles_tab), ("About", self._setup_about_tab)):
+            container = ttk.Frame(self.notebook, padding=15)
+            self.notebook.add(container, text=text)
+            self._lazy_tabs[str(container)] = (container, builder)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Create status bar
         self.status_var = tk.StringVar(value="Ready")
@@ -1009,15 +1245,6 @@ class SystemTrayApp:
         bottom_frame = ttk.Frame(main_frame, padding=(15, 10))
         bottom_frame.pack(side=tk.BOTTOM, fill=tk.X, before=status_bar)
         
-        # Toggle button (left-aligned)
-        self.toggle_button = ttk.Button(
-            bottom_frame, 
-            text="Enable Filter", 
-            command=self._toggle_filter,
-            style="Accent.TButton"
-        )
-        self.toggle_button.pack(side=tk.LEFT)
-        
         # Close button (right-aligned)
         close_button = ttk.Button(
             bottom_frame, 
@@ -1034,7 +1261,7 @@ class SystemTrayApp:
     
     def _configure_styles(self):
         """Configure ttk styles for better UI appearance"""
-        style = ttk.Style()
+        style = self._style
         
         # Configure frames
         style.configure("TFrame", background=COLORS["background"])
@@ -1042,8 +1269,8 @@ class SystemTrayApp:
         
         # Configure labels
         style.configure("TLabel", background=COLORS["background"], foreground=COLORS["text"])
-        style.configure("Header.TLabel", font=font.Font(size=14, weight="bold"))
-        style.configure("Subheader.TLabel", font=font.Font(size=12, weight="bold"))
+        style.configure("Header.TLabel", font=self.fonts["header"])
+        style.configure("Subheader.TLabel", font=self.fonts["bold12"])
         style.configure("Info.TLabel", foreground=COLORS["text_secondary"])
         
         # Configure buttons
@@ -1065,7 +1292,7 @@ class SystemTrayApp:
         
         # Configure notebook (tabs)
         style.configure("TNotebook", background=COLORS["background"], borderwidth=0)
-        style.configure("TNotebook.Tab", background=COLORS["background"], padding=(15, 5), font=font.Font(size=10))
+        style.configure("TNotebook.Tab", background=COLORS["background"], padding=(15, 5), font=self.fonts["normal10"])
         style.map("TNotebook.Tab", 
                  background=[("selected", "#ffffff")],
                  foreground=[("selected", COLORS["primary"])])
@@ -1081,7 +1308,7 @@ class SystemTrayApp:
         # Configure labelframe
         style.configure("TLabelframe", background="#ffffff", foreground=COLORS["text"], 
                        borderwidth=1, relief=tk.GROOVE)
-        style.configure("TLabelframe.Label", background="#ffffff", foreground=COLORS["primary"], font=font.Font(size=12, weight="bold"))
+        style.configure("TLabelframe.Label", background="#ffffff", foreground=COLORS["primary"], font=self.fonts["bold12"])
     
     def _create_header(self, main_frame):
         """Create a header with logo and title"""
@@ -1100,7 +1327,7 @@ class SystemTrayApp:
         title_label = ttk.Label(
             title_frame, 
             text="OpenBlueFilter", 
-            font=font.Font(family=font.nametofont("TkDefaultFont").cget("family"), size=16, weight="bold"),
+            font=self.fonts["title"],
             background=COLORS["background"],
             foreground=COLORS["primary"]
         )
@@ -1127,7 +1354,7 @@ class SystemTrayApp:
         intensity_frame = ttk.Frame(sliders_frame)
         intensity_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(intensity_frame, text="Intensity:", font=font.Font(size=10, weight="bold")).pack(anchor=tk.W)
+        ttk.Label(intensity_frame, text="Intensity:", font=self.fonts["bold10"]).pack(anchor=tk.W)
         
         self.intensity_var = tk.DoubleVar(value=0.5)
         intensity_scale = ttk.Scale(
@@ -1135,7 +1362,7 @@ class SystemTrayApp:
             from_=0.0,
             to=1.0,
             variable=self.intensity_var,
-            command=self._on_intensity_changed,
+            command=functools.partial(self._on_slider_changed, "intensity", self.intensity_var),
             length=300
         )
         intensity_scale.pack(fill=tk.X, pady=(5, 0))
@@ -1152,7 +1379,7 @@ class SystemTrayApp:
         temp_frame = ttk.Frame(sliders_frame)
         temp_frame.pack(fill=tk.X, pady=(15, 0))
         
-        ttk.Label(temp_frame, text="Color Temperature:", font=font.Font(size=10, weight="bold")).pack(anchor=tk.W)
+        ttk.Label(temp_frame, text="Color Temperature:", font=self.fonts["bold10"]).pack(anchor=tk.W)
         
         self.temp_var = tk.DoubleVar(value=0.5)
         temp_scale = ttk.Scale(
@@ -1160,7 +1387,7 @@ class SystemTrayApp:
             from_=0.0,
             to=1.0,
             variable=self.temp_var,
-            command=self._on_temp_changed,
+            command=functools.partial(self._on_slider_changed, "color_temperature", self.temp_var),
             length=300
         )
         temp_scale.pack(fill=tk.X, pady=(5, 0))
@@ -1211,14 +1438,14 @@ class SystemTrayApp:
         # Add Settings tab to notebook
         self.notebook.add(settings_container, text="Settings")
     
-    def _setup_profiles_tab(self):
-        # Create a container for profiles tab with padding
-        profiles_container = ttk.Frame(self.notebook, padding=15)
-        profiles_container.pack(fill=tk.BOTH, expand=True)
-        
-        # Add to notebook
-        self.notebook.add(profiles_container, text="Profiles")
-        
+    def _on_tab_changed(self, event):
+        """Build a lazily created tab the first time it is selected"""
+        entry = self._lazy_tabs.pop(self.notebook.select(), None)
+        if entry:
+            container, builder = entry
+            builder(container)
+    
+    def _setup_profiles_tab(self, profiles_container):
         # Create profile selector frame
         select_frame = ttk.LabelFrame(profiles_container, text="Select Profile", padding=10)
         select_frame.pack(fill=tk.X, pady=(0, 15))
@@ -1228,7 +1455,7 @@ class SystemTrayApp:
             select_frame, 
             height=4,
             exportselection=0,  # Prevent deselection when focus changes
-            font=font.Font(size=11)
+            font=self.fonts["normal11"]
         )
         self.profiles_listbox.pack(fill=tk.X, padx=5, pady=5)
         self.profiles_listbox.bind('<<ListboxSelect>>', self._on_profile_selected)
@@ -1267,7 +1494,7 @@ class SystemTrayApp:
         current_profile_label = ttk.Label(
             settings_frame, 
             textvariable=self.current_profile_name,
-            font=font.Font(size=11, weight='bold')
+            font=self.fonts["bold11"]
         )
         current_profile_label.pack(anchor=tk.W, pady=(0, 10))
         
@@ -1354,20 +1581,16 @@ class SystemTrayApp:
             command=self._delete_profile
         )
         delete_btn.pack(side=tk.LEFT)
-    
-    def _setup_about_tab(self):
-        # Create a container frame for the About tab
-        about_container = ttk.Frame(self.notebook, padding=15)
-        about_container.pack(fill=tk.BOTH, expand=True)
-        
-        # Add to notebook
-        self.notebook.add(about_container, text="About")
         
+        # The tab is built after startup settings were applied, so show the active profile now
+        self._select_active_profile()
+    
+    def _setup_about_tab(self, about_container):
         # Add About content
         ttk.Label(
             about_container,
             text="OpenBlueFilter",
-            font=font.Font(size=16, weight='bold')
+            font=self.fonts["h1"]
         ).pack(anchor=tk.CENTER, pady=(20, 5))
         
         ttk.Label(
@@ -1390,35 +1613,21 @@ class SystemTrayApp:
         features_frame = ttk.LabelFrame(about_container, text="Features", padding=10)
         features_frame.pack(fill=tk.X, pady=(0, 20))
         
-        features = [
-            "• Adjustable blue light filter intensity",
-            "• Customizable color temperature",
-            "• Saved profiles for different times of day",
-            "• Minimal system resources usage",
-            "• System tray integration for easy access"
-        ]
-        
-        for feature in features:
-            ttk.Label(features_frame, text=feature).pack(anchor=tk.W, pady=2)
+        # One multi-line label instead of a widget per line
+        ttk.Label(features_frame, text="\n".join(ABOUT_FEATURES), justify=tk.LEFT).pack(anchor=tk.W, pady=2)
         
         # System info section
         system_frame = ttk.LabelFrame(about_container, text="System Information", padding=10)
         system_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Get system info
-        import platform
-        system_info = [
-            f"Platform: {platform.system()} {platform.release()}",
-            f"Python: {platform.python_version()}",
-            f"Processor: {platform.processor()}",
-        ]
+        system_info = list(_system_info_lines())
         
         # Display admin status
         admin_status = "Running as Administrator: Yes" if is_admin() else "Running as Standard User"
         system_info.append(admin_status)
         
-        for info in system_info:
-            ttk.Label(system_frame, text=info).pack(anchor=tk.W, pady=2)
+        ttk.Label(system_frame, text="\n".join(system_info), justify=tk.LEFT).pack(anchor=tk.W, pady=2)
         
         # Links and credits
         links_frame = ttk.LabelFrame(about_container, text="Links", padding=10)
@@ -1429,7 +1638,7 @@ class SystemTrayApp:
             webbrowser.open(url)
         
         # Create hyperlink style labels
-        link_style = {'foreground': 'blue', 'cursor': 'hand2', 'font': font.Font(size=10, underline=True)}
+        link_style = {'foreground': 'blue', 'cursor': 'hand2', 'font': self.fonts["link"]}
         
         # GitHub link
         github_link = tk.Label(links_frame, text="GitHub Repository", **link_style)
@@ -1470,37 +1679,38 @@ class SystemTrayApp:
             self.logger.error(f"Error toggling filter: {e}")
             messagebox.showerror("Error", "Failed to toggle the blue light filter")
     
-    def _on_intensity_changed(self, value):
-        """Handle intensity slider change"""
-        try:
-            # Convert string value to float (0-1 range)
-            intensity = float(value)
-            
-            # Update filter
-            self.filter_manager.set_intensity(intensity)
-            
-            # Save to configuration
-            self.config_manager.set("filter.intensity", intensity)
-            
-            self.logger.info(f"Setting filter intensity to {intensity}")
-        except Exception as e:
-            self.logger.error(f"Error changing intensity: {e}")
+    def _on_slider_changed(self, setting, var, _value=None):
+        """Handle a filter slider change; applied at once, then at most once per interval while dragging"""
+        if setting in self._slider_after_ids:
+            self._slider_pending.add(setting)
+            return
+        self._apply_slider_change(setting, var)
+        self._slider_after_ids[setting] = self.root.after(
+            SLIDER_DEBOUNCE_MS, self._end_slider_window, setting, var)
+    
+    def _end_slider_window(self, setting, var):
+        """Flush a change made during the throttle window and keep throttling, or close the window"""
+        if setting in self._slider_pending:
+            self._slider_pending.discard(setting)
+            self._apply_slider_change(setting, var)
+            self._slider_after_ids[setting] = self.root.after(
+                SLIDER_DEBOUNCE_MS, self._end_slider_window, setting, var)
+        else:
+            del self._slider_after_ids[setting]
     
-    def _on_temp_changed(self, value):
-        """Handle color temperature slider change"""
+    def _apply_slider_change(self, setting, var):
+        """Apply the latest value of a filter slider to the filter and the configuration"""
         try:
-            # Convert string value to float (0-1 range)
-            color_temp = float(value)
+            # DoubleVar.get() already returns a float in the slider's 0-1 range
+            value = var.get()
             
             # Update filter
-            self.filter_manager.set_color_temperature(color_temp)
+            self.filter_manager.set(**{setting: value})
             
             # Save to configuration
-            self.config_manager.set("filter.color_temperature", color_temp)
-            
-            self.logger.info(f"Setting color temperature to {color_temp}K")
+            self.config_manager.set(f"filter.{setting}", value)
         except Exception as e:
-            self.logger.error(f"Error changing color temperature: {e}")
+            self.logger.error(f"Error changing {setting.replace('_', ' ')}: {e}")
     
     def _on_profile_selected(self, event):
         """Handle profile selection in the listbox"""
@@ -1568,49 +1778,54 @@ class SystemTrayApp:
     def _update_profiles(self):
         """Update the profiles listbox with available profiles in specific order"""
         try:
-            # Get profiles from the profile manager
-            profiles = self.profile_manager.get_all_profiles()
-            
-            # Define the preferred order
-            preferred_order = ["Morning", "Evening", "Night"]
-            
-            # Create an ordered list of profile names
-            ordered_profiles = []
-            
-            # First add the preferred profiles in order
-            for profile in preferred_order:
-                if profile in profiles:
-                    ordered_profiles.append(profile)
-            
-            # Then add any other profiles alphabetically
-            for profile in sorted(profiles):
-                if profile not in ordered_profiles:
-                    ordered_profiles.append(profile)
+            # Get profiles from the profile manager, already in display order
+            ordered_profiles = self.profile_manager.get_all_profiles()
             
             # Update the listbox
             if hasattr(self, 'profiles_listbox'):
-                # Clear the listbox
-                self.profiles_listbox.delete(0, tk.END)
-                
-                # Add profiles to the listbox
-                for profile in ordered_profiles:
-                    self.profiles_listbox.insert(tk.END, profile)
+                # Only touch the listbox when the set or order of names changed
+                if ordered_profiles != self._last_listbox_names:
+                    self._sync_profiles_listbox(ordered_profiles)
                 
                 # If there's a current active profile, select it
                 active_profile = self.config_manager.get("active_profile", "")
-                if active_profile and active_profile in ordered_profiles:
+                index = self.profile_manager.get_profile_index(active_profile)
+                if index is not None:
                     try:
-                        index = ordered_profiles.index(active_profile)
                         self.profiles_listbox.selection_clear(0, tk.END)
                         self.profiles_listbox.selection_set(index)
                         self.profiles_listbox.see(index)
-                    except (ValueError, tk.TclError) as e:
+                    except tk.TclError as e:
                         self.logger.error(f"Error selecting active profile in listbox: {e}")
             
-            self.logger.info(f"Updated profiles list: {ordered_profiles}")
+            # Formatting the whole list is only worth it if the message is emitted
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Updated profiles list: %s", ordered_profiles)
         except Exception as e:
             self.logger.error(f"Error updating profiles: {e}")
     
+    def _sync_profiles_listbox(self, names):
+        """Bring the listbox to the given names with targeted inserts and deletes"""
+        listbox = self.profiles_listbox
+        shown = self._last_listbox_names or ()
+        
+        # Both sequences share the same display order, so one walk over them is
+        # enough; the listbox always holds names[:j] followed by shown[i:]
+        wanted = set(names)
+        i = j = 0
+        while i < len(shown) or j < len(names):
+            if i < len(shown) and j < len(names) and shown[i] == names[j]:
+                i += 1
+                j += 1
+            elif i < len(shown) and shown[i] not in wanted:
+                listbox.delete(j)
+                i += 1
+            else:
+                listbox.insert(j, names[j])
+                j += 1
+        
+        self._last_listbox_names = names
+    
     def _save_profile(self):
         """Save current settings to the selected profile"""
         try:
@@ -1652,11 +1867,7 @@ class SystemTrayApp:
                     self._update_profiles()
                     
                     # Select default profile if available
-                    profiles = self.profile_manager.get_all_profiles()
-                    if profiles:
-                        self.profile_var.set(next(iter(profiles.keys())))
-                    else:
-                        self.profile_var.set("")
+                    self.profile_var.set(self.profile_manager.get_first_profile_name() or "")
                         
                     self.status_var.set(f"Profile deleted: {profile_name}")
                     self.logger.info(f"Deleted profile: {profile_name}")
@@ -1672,11 +1883,10 @@ class SystemTrayApp:
         is_enabled = self.schedule_enabled_var.get()
         schedule_mode = self.schedule_mode_var.get()
         
-        self.logger.info(f"Schedule {'enabled' if is_enabled else 'disabled'}, mode: {schedule_mode}")
+        self.logger.info("Schedule %s, mode: %s", "enabled" if is_enabled else "disabled", schedule_mode)
         
-        # Clear any existing warning messages
-        for widget in self.schedule_warning_frame.winfo_children():
-            widget.destroy()
+        # Clear any existing warning message
+        self._hide_schedule_warning()
         
         # Update configuration
         self.config_manager.set("schedule.enabled", is_enabled)
@@ -1691,12 +1901,7 @@ class SystemTrayApp:
                 
                 if not valid_start or not valid_end:
                     # Show warning and prevent enabling
-                    warning_label = ttk.Label(
-                        self.schedule_warning_frame,
-                        text="Invalid time format. Please use HH:MM format (24-hour).",
-                        foreground=COLORS["error"]
-                    )
-                    warning_label.pack(anchor=tk.W, pady=(5, 0))
+                    self._show_schedule_warning("Invalid time format. Please use HH:MM format (24-hour).")
                     
                     self.schedule_enabled_var.set(False)
                     self.config_manager.set("schedule.enabled", False)
@@ -1708,12 +1913,7 @@ class SystemTrayApp:
                     not self.evening_enabled_var.get() and 
                     not self.night_enabled_var.get()):
                     
-                    warning_label = ttk.Label(
-                        self.schedule_warning_frame,
-                        text="Please enable at least one profile time period.",
-                        foreground=COLORS["error"]
-                    )
-                    warning_label.pack(anchor=tk.W, pady=(5, 0))
+                    self._show_schedule_warning("Please enable at least one profile time period.")
                     
                     self.schedule_enabled_var.set(False)
                     self.config_manager.set("schedule.enabled", False)
@@ -1727,14 +1927,26 @@ class SystemTrayApp:
             success = self.scheduler.update_schedule()
             
             if not success and is_enabled:
-                warning_label = ttk.Label(
-                    self.schedule_warning_frame,
-                    text="Failed to set up scheduler. Check times and try again.",
-                    foreground=COLORS["error"]
-                )
-                warning_label.pack(anchor=tk.W, pady=(5, 0))
+                self._show_schedule_warning("Failed to set up scheduler. Check times and try again.")
                 return
     
+    def _show_schedule_warning(self, text):
+        """Show a warning below the schedule options, reusing a single label"""
+        if self._schedule_warning_label is None:
+            self._schedule_warning_var = tk.StringVar()
+            self._schedule_warning_label = ttk.Label(
+                self.schedule_warning_frame,
+                textvariable=self._schedule_warning_var,
+                foreground=COLORS["error"]
+            )
+        self._schedule_warning_var.set(text)
+        self._schedule_warning_label.pack(anchor=tk.W, pady=(5, 0))
+    
+    def _hide_schedule_warning(self):
+        """Hide the schedule warning label if it is showing"""
+        if self._schedule_warning_label is not None:
+            self._schedule_warning_label.pack_forget()
+    
     def validate_and_format_start_time(self):
         """Validate and format start time"""
         return self._validate_time(self.start_time_var)
@@ -1745,47 +1957,41 @@ class SystemTrayApp:
     
     def _validate_time(self, string_var):
         """Validate and format time string"""
-        try:
-            time_str = string_var.get().strip()
-            
-            # Handle empty string
-            if not time_str:
-                return None
-                
-            # Basic validation for HH:MM format
-            if ":" not in time_str:
-                # Try to automatically format if it's just digits
-                if time_str.isdigit() and len(time_str) == 4:  # e.g. "2030" -> "20:30"
-                    time_str = f"{time_str[:2]}:{time_str[2:]}"
-                    string_var.set(time_str)
-                else:
-                    return None
-            
-            # Further validation
-            parts = time_str.split(":")
-            if len(parts) != 2:
-                return None
-                
-            hour = int(parts[0])
-            minute = int(parts[1])
-            
-            if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-                return None
-                
-            # Format consistently as HH:MM
-            formatted = f"{hour:02d}:{minute:02d}"
-            if formatted != time_str:
-                string_var.set(formatted)
-                
-            return formatted
-            
-        except (ValueError, IndexError):
+        time_str = string_var.get().strip()
+        
+        # One match covers both the HH:MM and the bare-digit forms
+        match = _TIME_RE.fullmatch(time_str)
+        if match is None:
+            return None
+        
+        hour = int(match[1] or match[3])
+        minute = int(match[2] or match[4])
+        if hour > 23 or minute > 59:
             return None
+        
+        # Format consistently as HH:MM
+        formatted = f"{hour:02d}:{minute:02d}"
+        if formatted != time_str:
+            string_var.set(formatted)
+        
+        return formatted
     
     def _on_schedule_mode_changed(self):
         """Handle schedule mode change between manual and profile-based"""
         mode = self.schedule_mode_var.get()
         
+        # Re-selecting the current mode leaves the options as they are; only the
+        # dropdowns may need new profile names
+        if mode == self._last_schedule_mode:
+            if mode != "manual":
+                self._update_schedule_combos(self.profile_manager.get_all_profiles())
+            return
+        self._last_schedule_mode = mode
+        
+        # Read the saved schedule state once for the checkbox below
+        was_enabled = self.config_manager.get("schedule.enabled", False)
+        saved_mode = self.config_manager.get("schedule.mode", "manual")
+        
         # Clear current options
         for widget in self.schedule_options_frame.winfo_children():
             widget.pack_forget()
@@ -1803,126 +2009,129 @@ class SystemTrayApp:
                 self.start_time_var.set(saved_start)
             if saved_end:
                 self.end_time_var.set(saved_end)
-                
-            # Update enable checkbox state
-            was_enabled = self.config_manager.get("schedule.enabled", False)
-            if was_enabled and self.config_manager.get("schedule.mode", "manual") == "manual":
-                self.schedule_enabled_var.set(True)
-            else:
-                self.schedule_enabled_var.set(False)
         else:  # profile mode
             self.profile_frame.pack(fill=tk.X)
             
             # Update profile dropdowns with current profiles
-            profiles = list(self.profile_manager.get_all_profiles().keys())
-            
-            for combo in [self.morning_profile_combo, self.evening_profile_combo, self.night_profile_combo]:
-                combo['values'] = profiles
-                if not profiles:
-                    combo.set("")
-                    combo.configure(state="disabled")
-                else:
-                    combo.configure(state="readonly")
+            profiles = self.profile_manager.get_all_profiles()
+            self._update_schedule_combos(profiles)
             
-            # Set default values if not already set
-            if not self.morning_profile_var.get() and profiles:
-                    if "Morning" in profiles:
-                        self.morning_profile_var.set("Morning")
-                    else:
-                        self.morning_profile_var.set(profiles[0])
-                        
-            if not self.evening_profile_var.get() and profiles:
-                    if "Evening" in profiles:
-                        self.evening_profile_var.set("Evening")
-                    else:
-                        self.evening_profile_var.set(profiles[0])
-                        
-            if not self.night_profile_var.get() and profiles:
-                    if "Night" in profiles:
-                        self.night_profile_var.set("Night")
-                    else:
-                        self.night_profile_var.set(profiles[0])
-                    
-            # Update enable checkbox state
-            was_enabled = self.config_manager.get("schedule.enabled", False)
-            if was_enabled and self.config_manager.get("schedule.mode", "manual") == "profile":
-                self.schedule_enabled_var.set(True)
-            else:
-                self.schedule_enabled_var.set(False)
+            # Set default values if not already set, preferring the built-in profile for each period
+            if profiles:
+                has_profile = self.profile_manager.has_profile
+                for var, preferred in ((self.morning_profile_var, "Morning"),
+                                       (self.evening_profile_var, "Evening"),
+                                       (self.night_profile_var, "Night")):
+                    if not var.get():
+                        var.set(preferred if has_profile(preferred) else profiles[0])
+        
+        # The checkbox is only ticked if the saved schedule is enabled for this mode
+        self.schedule_enabled_var.set(bool(was_enabled and saved_mode == mode))
         
         # Update the config with the new mode
         self.config_manager.set("schedule.mode", mode)
     
+    def _update_schedule_combos(self, profiles):
+        """Load the profile names into the schedule dropdowns if they changed"""
+        if profiles == self._last_combo_profiles:
+            return
+        self._last_combo_profiles = profiles
+        
+        for combo in (self.morning_profile_combo, self.evening_profile_combo, self.night_profile_combo):
+            combo['values'] = profiles
+            if not profiles:
+                combo.set("")
+                combo.configure(state="disabled")
+            else:
+                combo.configure(state="readonly")
+    
+    def _schedule_snapshot(self):
+        """Get the current schedule form values as a comparable tuple"""
+        return (
+            self.schedule_enabled_var.get(), self.schedule_mode_var.get(),
+            self.start_time_var.get(), self.end_time_var.get(),
+            self.morning_enabled_var.get(), self.morning_profile_var.get(),
+            self.evening_enabled_var.get(), self.evening_profile_var.get(),
+            self.night_enabled_var.get(), self.night_profile_var.get(),
+        )
+    
     def _save_schedule(self):
         """Save schedule settings and apply immediately"""
         try:
-            # Get values from UI
-            is_enabled = self.schedule_enabled_var.get()
-            current_mode = self.schedule_mode_var.get()
-            
-            # Save common settings
-            self.config_manager.set("schedule.enabled", is_enabled)
-            self.config_manager.set("schedule.mode", current_mode)
-            
-            # Save mode-specific settings
-            if current_mode == "manual":
-                # Save manual time settings
-                start_time = self.validate_and_format_start_time()
-                end_time = self.validate_and_format_end_time()
-                
-                # Validate times
-                if is_enabled and (not start_time or not end_time):
-                    messagebox.showwarning(
-                        "Invalid Schedule", 
-                        "Please enter valid start and end times in HH:MM format"
-                    )
-                    # Don't save invalid schedule
-                    return
-                
-                if start_time:
-                    self.config_manager.set("schedule.start_time", start_time)
-                if end_time:
-                    self.config_manager.set("schedule.end_time", end_time)
-                
-                # Log the saved schedule
-                self.logger.info(f"Saved manual schedule: start={start_time}, end={end_time}, enabled={is_enabled}")
+            # Read every form value once; the rest of the save works from this snapshot
+            snapshot = self._schedule_snapshot()
+            
+            # Saving an unchanged form would only rewrite the config and rebuild the scheduler
+            if snapshot == self._last_saved_schedule:
+                self.status_var.set("No changes to save")
+                return
+            
+            (is_enabled, current_mode, _start, _end,
+             morning_enabled, morning_profile, evening_enabled, evening_profile,
+             night_enabled, night_profile) = snapshot
+            
+            # Write all schedule settings to disk once, when the block exits
+            with self.config_manager.batch():
+                # Save common settings
+                self.config_manager.set("schedule.enabled", is_enabled)
+                self.config_manager.set("schedule.mode", current_mode)
                 
-                # Update UI
-                status_text = "Schedule saved"
-                if is_enabled:
-                    status_text = f"Manual schedule active: {start_time} to {end_time}"
+                # Save mode-specific settings
+                if current_mode == "manual":
+                    # Save manual time settings
+                    start_time = self.validate_and_format_start_time()
+                    end_time = self.validate_and_format_end_time()
                     
-                    # Show a confirmation message
-                    messagebox.showinfo(
-                        "Schedule Saved",
-                        f"The filter will be active from {start_time} to {end_time} daily.\n\n"
-                        "The schedule will run automatically in the background."
-                    )
-            else:
-                # Save profile-based settings
-                self.config_manager.set("schedule.morning.enabled", self.morning_enabled_var.get())
-                self.config_manager.set("schedule.morning.profile", self.morning_profile_var.get())
-                
-                self.config_manager.set("schedule.evening.enabled", self.evening_enabled_var.get())
-                self.config_manager.set("schedule.evening.profile", self.evening_profile_var.get())
-                
-                self.config_manager.set("schedule.night.enabled", self.night_enabled_var.get())
-                self.config_manager.set("schedule.night.profile", self.night_profile_var.get())
-                
-                # Update UI
-                status_text = "Profile schedule saved"
-                if is_enabled:
-                    status_text = "Profile-based schedule active"
+                    # Validate times
+                    if is_enabled and (not start_time or not end_time):
+                        messagebox.showwarning(
+                            "Invalid Schedule", 
+                            "Please enter valid start and end times in HH:MM format"
+                        )
+                        # Don't save invalid schedule
+                        return
                     
-                    # Show confirmation message
-                    messagebox.showinfo(
-                        "Profile Schedule Saved",
-                        "The profile-based schedule has been saved and activated.\n\n"
-                        "Profiles will switch automatically at the scheduled times."
-                    )
-            
-            # Save configuration to file
-            self.config_manager._save_config()
+                    if start_time:
+                        self.config_manager.set("schedule.start_time", start_time)
+                    if end_time:
+                        self.config_manager.set("schedule.end_time", end_time)
+                    
+                    # Log the saved schedule
+                    self.logger.info(f"Saved manual schedule: start={start_time}, end={end_time}, enabled={is_enabled}")
+                    
+                    # Update UI
+                    status_text = "Schedule saved"
+                    if is_enabled:
+                        status_text = f"Manual schedule active: {start_time} to {end_time}"
+                        
+                        # Show a confirmation message
+                        messagebox.showinfo(
+                            "Schedule Saved",
+                            f"The filter will be active from {start_time} to {end_time} daily.\n\n"
+                            "The schedule will run automatically in the background."
+                        )
+                else:
+                    # Save profile-based settings
+                    self.config_manager.set("schedule.morning.enabled", morning_enabled)
+                    self.config_manager.set("schedule.morning.profile", morning_profile)
+                    
+                    self.config_manager.set("schedule.evening.enabled", evening_enabled)
+                    self.config_manager.set("schedule.evening.profile", evening_profile)
+                    
+                    self.config_manager.set("schedule.night.enabled", night_enabled)
+                    self.config_manager.set("schedule.night.profile", night_profile)
+                    
+                    # Update UI
+                    status_text = "Profile schedule saved"
+                    if is_enabled:
+                        status_text = "Profile-based schedule active"
+                        
+                        # Show confirmation message
+                        messagebox.showinfo(
+                            "Profile Schedule Saved",
+                            "The profile-based schedule has been saved and activated.\n\n"
+                            "Profiles will switch automatically at the scheduled times."
+                        )
             
             # Update the scheduler with new settings
             self.scheduler.update_schedule()
@@ -1935,30 +2144,35 @@ class SystemTrayApp:
             self.status_var.set(status_text)
             self.logger.info(f"Schedule saved - mode: {current_mode}, enabled: {is_enabled}")
             
+            # Times may have been reformatted above, so take the snapshot now
+            self._last_saved_schedule = self._schedule_snapshot()
+            
         except Exception as e:
-            self.logger.error(f"Error saving schedule: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.error(f"Error saving schedule: {e}", exc_info=True)
             messagebox.showerror("Error", f"Failed to save schedule: {e}")
     
     def _update_filter_ui(self):
         """Update UI elements to reflect current filter state"""
         try:
+            # Widgets only need reconfiguring when the state actually changed
+            enabled = self.filter_manager.is_enabled()
+            if enabled == self._last_filter_ui_state:
+                return
+            self._last_filter_ui_state = enabled
+            
             # Update toggle button text
-            if self.filter_manager.is_enabled():
+            if enabled:
                 self.toggle_button.config(text="Disable Filter")
                 self.status_var.set("Filter: Enabled")
-                
-                # Set icon to enabled version if available
-                if 'app_enabled' in self.icons and hasattr(self, 'app_icon_label'):
-                    self.app_icon_label.config(image=self.icons['app_enabled'])
+                icon = self._icon_on
             else:
                 self.toggle_button.config(text="Enable Filter")
                 self.status_var.set("Filter: Disabled")
-                
-                # Set icon to disabled version if available
-                if 'app' in self.icons and hasattr(self, 'app_icon_label'):
-                    self.app_icon_label.config(image=self.icons['app'])
+                icon = self._icon_off
+            
+            # Set the matching icon if available
+            if icon is not None and self._icon_label is not None:
+                self._icon_label.config(image=icon)
         except Exception as e:
             self.logger.error(f"Error updating UI: {e}")
     
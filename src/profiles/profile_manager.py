@@ -7,6 +7,8 @@ class ProfileManager:
         self.filter_manager = filter_manager
         
     def get_all_profiles(self):
+        # The config's in-memory profiles dict itself (no copy, no disk read); name
+        # lookups on it are already O(1), so there is nothing worth caching here
         return self.config_manager.get_all_profiles()
     
     def get_active_profile_name(self):
@@ -21,13 +23,11 @@ class ProfileManager:
         return profiles.get(profile_name)
     
     def activate_profile(self, profile_name):
-        profiles = self.get_all_profiles()
+        profile_settings = self.get_all_profiles().get(profile_name)
         
-        if profile_name not in profiles:
+        if profile_settings is None:
             self.logger.error(f"Profile '{profile_name}' does not exist")
             return False
-            
-        profile_settings = profiles[profile_name]
         
         # Update the active profile in config
         self.config_manager.set("active_profile", profile_name)
@@ -93,9 +93,9 @@ class ProfileManager:
                 }
             }
             
-            for name, settings in default_profiles.items():
-                self.save_profile(name, settings["intensity"], settings["color_temperature"])
-                
+            self.config_manager.save_profiles(default_profiles)
+            self.logger.info(f"Saved profiles: {', '.join(default_profiles)}")
+            
             # Set Day as the default active profile
             self.config_manager.set("active_profile", "Day")
             return True
@@ -3,13 +3,44 @@ import os
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QGroupBox, QPushButton, QLabel, QComboBox, 
                            QCheckBox, QTimeEdit, QLineEdit, QTabWidget,
-                           QDialog, QDialogButtonBox, QMessageBox, QFrame)
-from PyQt6.QtCore import Qt, QTime
+                           QDialog, QDialogButtonBox, QMessageBox, QFrame, QLayout)
+from PyQt6.QtCore import Qt, QTime, QTimer, QSignalBlocker, pyqtSignal
 from PyQt6.QtGui import QIcon, QFont
 
 from .widgets.slider_widget import PercentageSlider, TemperatureSlider
 
+# Icon files live in the resources directory at the repository root
+_RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "resources")
+_ICON_PATH = os.path.join(_RESOURCES_DIR, "icon.png")
+
+# Style for the small gray hint text under controls
+_HINT_STYLE = "font-size: 10px; color: gray;"
+
+# Font of the About tab title; built on first use since it needs a running QApplication
+_TITLE_FONT = None
+
+def _title_font():
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = QFont("Arial", 18, QFont.Weight.Bold)
+    return _TITLE_FONT
+
+# Pause in typing after which an edited latitude/longitude is written to the config
+_LOCATION_COMMIT_MS = 300
+
+# Minimum interval between slider-driven filter updates (about one display frame)
+_SLIDER_APPLY_MS = 16
+
+# Interval at which unsaved config changes are written, so they survive a crash
+_CONFIG_FLUSH_MS = 30000
+
+# Format of the schedule times, both on screen and in the config
+_TIME_FMT = "HH:mm"
+
 class MainWindow(QMainWindow):
+    # Emitted after a profile is created or deleted
+    profilesChanged = pyqtSignal()
+    
     def __init__(self, filter_manager, config_manager, profile_manager, scheduler):
         super().__init__()
         
@@ -19,6 +50,21 @@ class MainWindow(QMainWindow):
         self.profile_manager = profile_manager
         self.scheduler = scheduler
         
+        # Slider values waiting to be applied to the filter; a drag applies at most once per interval
+        self._pending_intensity = None
+        self._pending_temp = None
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(_SLIDER_APPLY_MS)
+        self._apply_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._apply_timer.timeout.connect(self._apply_pending)
+        
+        # Periodically write changes that were only made in memory (e.g. slider drags)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(_CONFIG_FLUSH_MS)
+        self._flush_timer.timeout.connect(self.config_manager.flush)
+        self._flush_timer.start()
+        
         # Initialize UI
         self._init_ui()
         
@@ -30,10 +76,8 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(500, 400)
         
         # Set the application icon
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                               "resources", "icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if os.path.exists(_ICON_PATH):
+            self.setWindowIcon(QIcon(_ICON_PATH))
         
         # Create central widget and main layout
         central_widget = QWidget()
@@ -61,11 +105,15 @@ class MainWindow(QMainWindow):
         about_tab = QWidget()
         tab_widget.addTab(about_tab, "About")
         
-        # Set up tab contents
+        # Set up tab contents; Settings is shown first, the others are built
+        # the first time they are selected
         self._setup_settings_tab(settings_tab)
-        self._setup_profiles_tab(profiles_tab)
-        self._setup_schedule_tab(schedule_tab)
-        self._setup_about_tab(about_tab)
+        self._lazy_tabs = {
+            tab_widget.indexOf(profiles_tab): (profiles_tab, self._setup_profiles_tab),
+            tab_widget.indexOf(schedule_tab): (schedule_tab, self._setup_schedule_tab),
+            tab_widget.indexOf(about_tab): (about_tab, self._setup_about_tab),
+        }
+        tab_widget.currentChanged.connect(self._ensure_tab)
         
         # Control buttons at the bottom
         control_layout = QHBoxLayout()
@@ -80,42 +128,50 @@ class MainWindow(QMainWindow):
         
         main_layout.addLayout(control_layout)
     
+    def _ensure_tab(self, index):
+        """Build a deferred tab the first time it is shown"""
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is not None:
+            tab, setup = entry
+            setup(tab)
+    
+    def _vgroup(self, title, *children):
+        # Group box with the given widgets and layouts stacked vertically
+        group = QGroupBox(title)
+        group_layout = QVBoxLayout(group)
+        for child in children:
+            if isinstance(child, QLayout):
+                group_layout.addLayout(child)
+            else:
+                group_layout.addWidget(child)
+        return group
+    
     def _setup_settings_tab(self, tab):
         layout = QVBoxLayout(tab)
         
-        # Filter Settings Group
-        filter_group = QGroupBox("Filter Settings")
-        filter_layout = QVBoxLayout(filter_group)
-        
         # Intensity slider (0-100%)
         self.intensity_slider = PercentageSlider("Filter Intensity:", 0, 100, 50)
         self.intensity_slider.valueChangedFloat.connect(self._on_intensity_changed)
-        filter_layout.addWidget(self.intensity_slider)
         
         # Color Temperature Slider (1000K to 6500K)
         self.temp_slider = TemperatureSlider("Color Temperature:", 1000, 6500, 3500)
         self.temp_slider.valueChanged.connect(self._on_temp_changed)
-        filter_layout.addWidget(self.temp_slider)
         
         # Add description for temperature
         temp_info = QLabel("Lower values = warmer (more orange/red), Higher values = cooler (more blue)")
-        temp_info.setStyleSheet("font-size: 10px; color: gray;")
-        filter_layout.addWidget(temp_info)
-        
-        layout.addWidget(filter_group)
+        temp_info.setStyleSheet(_HINT_STYLE)
         
-        # System Integration Group
-        system_group = QGroupBox("System Integration")
-        system_layout = QVBoxLayout(system_group)
+        # Filter Settings Group
+        layout.addWidget(self._vgroup("Filter Settings", self.intensity_slider, self.temp_slider, temp_info))
         
         # Start with system checkbox
         self.start_with_system_checkbox = QCheckBox("Start with system")
-        self.start_with_system_checkbox.stateChanged.connect(
-            lambda state: self.config_manager.set("start_with_system", state == Qt.CheckState.Checked.value)
+        self.start_with_system_checkbox.toggled.connect(
+            lambda checked: self.config_manager.set("start_with_system", checked)
         )
-        system_layout.addWidget(self.start_with_system_checkbox)
         
-        layout.addWidget(system_group)
+        # System Integration Group
+        layout.addWidget(self._vgroup("System Integration", self.start_with_system_checkbox))
         
         # Add spacer at the bottom
         layout.addStretch()
@@ -123,10 +179,6 @@ class MainWindow(QMainWindow):
     def _setup_profiles_tab(self, tab):
         layout = QVBoxLayout(tab)
         
-        # Profiles Group
-        profiles_group = QGroupBox("Profiles")
-        profiles_layout = QVBoxLayout(profiles_group)
-        
         # Profile selection
         profile_selector_layout = QHBoxLayout()
         profile_selector_layout.addWidget(QLabel("Active Profile:"))
@@ -135,8 +187,6 @@ class MainWindow(QMainWindow):
         self.profile_combo.currentTextChanged.connect(self._on_profile_selected)
         profile_selector_layout.addWidget(self.profile_combo, 1)
         
-        profiles_layout.addLayout(profile_selector_layout)
-        
         # Profile action buttons
         profile_actions_layout = QHBoxLayout()
         
@@ -152,41 +202,38 @@ class MainWindow(QMainWindow):
         self.delete_profile_button.clicked.connect(self._delete_current_profile)
         profile_actions_layout.addWidget(self.delete_profile_button)
         
-        profiles_layout.addLayout(profile_actions_layout)
-        
         # Divider line
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
-        profiles_layout.addWidget(line)
-        
-        # Current Profile Settings
-        profiles_layout.addWidget(QLabel("Profile Settings:"))
         
-        # Profile Intensity slider (0-100%)
+        # The selected profile's own values, edited here and stored with "Save"
         self.profile_intensity_slider = PercentageSlider("Filter Intensity:", 0, 100, 50)
-        profiles_layout.addWidget(self.profile_intensity_slider)
-        
-        # Profile Color Temperature Slider (1000K to 6500K)
         self.profile_temp_slider = TemperatureSlider("Color Temperature:", 1000, 6500, 3500)
-        profiles_layout.addWidget(self.profile_temp_slider)
         
-        layout.addWidget(profiles_group)
+        # Profiles Group, with the current profile's settings below the divider
+        layout.addWidget(self._vgroup(
+            "Profiles",
+            profile_selector_layout,
+            profile_actions_layout,
+            line,
+            QLabel("Profile Settings:"),
+            self.profile_intensity_slider,
+            self.profile_temp_slider,
+        ))
         
         # Add spacer at the bottom
         layout.addStretch()
+        
+        # Load profiles
+        self._load_profiles()
     
     def _setup_schedule_tab(self, tab):
         layout = QVBoxLayout(tab)
         
-        # Schedule Group
-        schedule_group = QGroupBox("Schedule")
-        schedule_layout = QVBoxLayout(schedule_group)
-        
         # Enable schedule checkbox
         self.schedule_enabled_checkbox = QCheckBox("Enable automatic scheduling")
-        self.schedule_enabled_checkbox.stateChanged.connect(self._on_schedule_enabled_changed)
-        schedule_layout.addWidget(self.schedule_enabled_checkbox)
+        self.schedule_enabled_checkbox.toggled.connect(self._on_schedule_enabled_changed)
         
         # Time settings
         times_layout = QHBoxLayout()
@@ -194,25 +241,22 @@ class MainWindow(QMainWindow):
         # Start time
         times_layout.addWidget(QLabel("Enable at:"))
         self.start_time_edit = QTimeEdit()
-        self.start_time_edit.setDisplayFormat("HH:mm")
+        self.start_time_edit.setDisplayFormat(_TIME_FMT)
         self.start_time_edit.timeChanged.connect(self._on_start_time_changed)
         times_layout.addWidget(self.start_time_edit)
         
         # End time
         times_layout.addWidget(QLabel("Disable at:"))
         self.end_time_edit = QTimeEdit()
-        self.end_time_edit.setDisplayFormat("HH:mm")
+        self.end_time_edit.setDisplayFormat(_TIME_FMT)
         self.end_time_edit.timeChanged.connect(self._on_end_time_changed)
         times_layout.addWidget(self.end_time_edit)
         
-        schedule_layout.addLayout(times_layout)
-        
         # Sunset/sunrise checkbox
         self.sunset_checkbox = QCheckBox("Adjust automatically based on sunset/sunrise")
-        self.sunset_checkbox.stateChanged.connect(
-            lambda state: self.config_manager.set("auto_adjust_with_sunset", state == Qt.CheckState.Checked.value)
+        self.sunset_checkbox.toggled.connect(
+            lambda checked: self.config_manager.set("auto_adjust_with_sunset", checked)
         )
-        schedule_layout.addWidget(self.sunset_checkbox)
         
         # Location settings for sunset/sunrise
         location_layout = QHBoxLayout()
@@ -221,25 +265,52 @@ class MainWindow(QMainWindow):
         location_layout.addWidget(QLabel("Latitude:"))
         self.latitude_edit = QLineEdit()
         self.latitude_edit.setPlaceholderText("e.g. 40.7128")
-        self.latitude_edit.textChanged.connect(
-            lambda text: self.config_manager.set("location.latitude", float(text) if text.strip() else None)
+        self._lat_timer = self._commit_timer(
+            lambda: self._commit_coordinate("location.latitude", self.latitude_edit)
         )
+        self.latitude_edit.textChanged.connect(lambda text: self._lat_timer.start())
         location_layout.addWidget(self.latitude_edit)
         
         location_layout.addWidget(QLabel("Longitude:"))
         self.longitude_edit = QLineEdit()
         self.longitude_edit.setPlaceholderText("e.g. -74.0060")
-        self.longitude_edit.textChanged.connect(
-            lambda text: self.config_manager.set("location.longitude", float(text) if text.strip() else None)
+        self._lon_timer = self._commit_timer(
+            lambda: self._commit_coordinate("location.longitude", self.longitude_edit)
         )
+        self.longitude_edit.textChanged.connect(lambda text: self._lon_timer.start())
         location_layout.addWidget(self.longitude_edit)
         
-        schedule_layout.addLayout(location_layout)
-        
-        layout.addWidget(schedule_group)
+        # Schedule Group
+        layout.addWidget(self._vgroup(
+            "Schedule",
+            self.schedule_enabled_checkbox,
+            times_layout,
+            self.sunset_checkbox,
+            location_layout,
+        ))
         
         # Add spacer at the bottom
         layout.addStretch()
+        
+        # Load schedule settings
+        self._load_schedule_settings()
+    
+    def _commit_timer(self, slot):
+        # Single-shot timer that each keystroke restarts, so slot runs once typing pauses
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(_LOCATION_COMMIT_MS)
+        timer.timeout.connect(slot)
+        return timer
+    
+    def _commit_coordinate(self, key, edit):
+        text = edit.text().strip()
+        try:
+            value = float(text) if text else None
+        except ValueError:
+            # Not a number (yet); keep the last valid value
+            return
+        self.config_manager.set(key, value)
     
     def _setup_about_tab(self, tab):
         layout = QVBoxLayout(tab)
@@ -247,7 +318,7 @@ class MainWindow(QMainWindow):
         # Logo/title
         title = QLabel("OpenBlueFilter")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        title.setFont(_title_font())
         layout.addWidget(title)
         
         # Version
@@ -279,74 +350,87 @@ class MainWindow(QMainWindow):
         layout.addWidget(website)
     
     def _load_settings(self):
-        # Load intensity
-        intensity = self.config_manager.get("intensity", 0.5)
-        self.intensity_slider.setValueFloat(intensity)
-        
-        # Load color temperature
-        color_temp = self.config_manager.get("color_temperature", 3500)
-        self.temp_slider.setValue(color_temp)
-        
-        # Load system integration settings
-        start_with_system = self.config_manager.get("start_with_system", False)
-        self.start_with_system_checkbox.setChecked(start_with_system)
-        
-        # Load schedule settings
-        schedule_enabled = self.config_manager.get("schedule_enabled", False)
-        self.schedule_enabled_checkbox.setChecked(schedule_enabled)
-        
-        # Parse time strings (HH:MM format)
-        start_time_str = self.config_manager.get("schedule_start", "20:00")
-        end_time_str = self.config_manager.get("schedule_end", "07:00")
-        
-        try:
-            start_hour, start_minute = map(int, start_time_str.split(':'))
-            self.start_time_edit.setTime(QTime(start_hour, start_minute))
-        except ValueError:
-            self.logger.warning(f"Invalid start time format: {start_time_str}")
+        # The values come from the config, so don't let the widgets echo them back
+        with QSignalBlocker(self.intensity_slider), QSignalBlocker(self.temp_slider), \
+                QSignalBlocker(self.start_with_system_checkbox):
+            # Load intensity
+            intensity = self.config_manager.get("intensity", 0.5)
+            self.intensity_slider.setValueFloat(intensity)
             
-        try:
-            end_hour, end_minute = map(int, end_time_str.split(':'))
-            self.end_time_edit.setTime(QTime(end_hour, end_minute))
-        except ValueError:
-            self.logger.warning(f"Invalid end time format: {end_time_str}")
-        
-        # Load sunset/sunrise settings
-        auto_adjust = self.config_manager.get("auto_adjust_with_sunset", False)
-        self.sunset_checkbox.setChecked(auto_adjust)
-        
-        # Load location
-        latitude = self.config_manager.get("location.latitude")
-        if latitude is not None:
-            self.latitude_edit.setText(str(latitude))
+            # Load color temperature
+            color_temp = self.config_manager.get("color_temperature", 3500)
+            self.temp_slider.setValue(color_temp)
             
-        longitude = self.config_manager.get("location.longitude")
-        if longitude is not None:
-            self.longitude_edit.setText(str(longitude))
-        
-        # Load profiles
-        self._load_profiles()
+            # Load system integration settings
+            start_with_system = self.config_manager.get("start_with_system", False)
+            self.start_with_system_checkbox.setChecked(start_with_system)
+    
+    def _load_schedule_settings(self):
+        # The values come from the config, so don't let the widgets echo them back
+        with QSignalBlocker(self.schedule_enabled_checkbox), QSignalBlocker(self.start_time_edit), \
+                QSignalBlocker(self.end_time_edit), QSignalBlocker(self.sunset_checkbox), \
+                QSignalBlocker(self.latitude_edit), QSignalBlocker(self.longitude_edit):
+            # Load schedule settings
+            schedule_enabled = self.config_manager.get("schedule_enabled", False)
+            self.schedule_enabled_checkbox.setChecked(schedule_enabled)
+            
+            # Parse time strings (HH:MM format)
+            start_time_str = self.config_manager.get("schedule_start", "20:00")
+            end_time_str = self.config_manager.get("schedule_end", "07:00")
+            
+            start_time = QTime.fromString(start_time_str, _TIME_FMT)
+            if start_time.isValid():
+                self.start_time_edit.setTime(start_time)
+            else:
+                self.logger.warning(f"Invalid start time format: {start_time_str}")
+                
+            end_time = QTime.fromString(end_time_str, _TIME_FMT)
+            if end_time.isValid():
+                self.end_time_edit.setTime(end_time)
+            else:
+                self.logger.warning(f"Invalid end time format: {end_time_str}")
+            
+            # Load sunset/sunrise settings
+            auto_adjust = self.config_manager.get("auto_adjust_with_sunset", False)
+            self.sunset_checkbox.setChecked(auto_adjust)
+            
+            # Load location
+            latitude = self.config_manager.get("location.latitude")
+            if latitude is not None:
+                self.latitude_edit.setText(str(latitude))
+                
+            longitude = self.config_manager.get("location.longitude")
+            if longitude is not None:
+                self.longitude_edit.setText(str(longitude))
     
     def _load_profiles(self):
-        # Clear existing items
-        self.profile_combo.clear()
-        
-        # Get all profiles and add to combo box
+        # Get all profiles and the active one
         profiles = self.profile_manager.get_all_profiles()
-        for profile_name in profiles:
-            self.profile_combo.addItem(profile_name)
-        
-        # Set current active profile
         active_profile = self.profile_manager.get_active_profile_name()
-        if active_profile and active_profile in profiles:
-            index = self.profile_combo.findText(active_profile)
+        
+        # Map each name to its combo position so lookups don't scan the combo with findText
+        self._profile_index = {name: i for i, name in enumerate(profiles)}
+        
+        # Refill the combo box in one go; reloading the list must not activate the
+        # profiles it passes through on the way
+        with QSignalBlocker(self.profile_combo):
+            self.profile_combo.clear()
+            self.profile_combo.addItems(list(profiles))
+            
+            # Set current active profile
+            index = self._profile_index.get(active_profile, -1)
             if index >= 0:
                 self.profile_combo.setCurrentIndex(index)
-                
-                # Load the profile settings into the profile sliders
-                profile = profiles[active_profile]
-                self.profile_intensity_slider.setValueFloat(profile.get("intensity", 0.5))
-                self.profile_temp_slider.setValue(profile.get("color_temperature", 3500))
+        
+        if index >= 0:
+            # Load the profile settings into the profile sliders
+            profile = profiles[active_profile]
+            self._show_profile_settings(profile.get("intensity", 0.5), profile.get("color_temperature", 3500))
+    
+    def _show_profile_settings(self, intensity, color_temp):
+        # The profile sliders have no slots connected, so setting them has no side effects
+        self.profile_intensity_slider.setValueFloat(intensity)
+        self.profile_temp_slider.setValue(color_temp)
     
     def _toggle_filter(self):
         # Toggle the filter state
@@ -357,31 +441,43 @@ class MainWindow(QMainWindow):
         self.toggle_button.setText("Disable Filter" if is_enabled else "Enable Filter")
     
     def _on_intensity_changed(self, value):
-        # Update filter intensity
-        self.filter_manager.set_intensity(value)
+        # Update filter intensity with the next batched update
+        self._pending_intensity = value
+        if not self._apply_timer.isActive():
+            self._apply_timer.start()
     
     def _on_temp_changed(self, value):
-        # Update color temperature
-        self.filter_manager.set_color_temperature(value)
+        # Update color temperature with the next batched update
+        self._pending_temp = value
+        if not self._apply_timer.isActive():
+            self._apply_timer.start()
+    
+    def _apply_pending(self):
+        # Apply the latest slider values that arrived since the last update
+        if self._pending_intensity is not None:
+            self.filter_manager.set_intensity(self._pending_intensity)
+            self._pending_intensity = None
+        if self._pending_temp is not None:
+            self.filter_manager.set_color_temperature(self._pending_temp)
+            self._pending_temp = None
     
     def _on_profile_selected(self, profile_name):
         if not profile_name:
             return
             
         # Get the profile
-        profiles = self.profile_manager.get_all_profiles()
-        if profile_name in profiles:
+        profile = self.profile_manager.get_all_profiles().get(profile_name)
+        if profile is not None:
             # Activate the profile
             self.profile_manager.activate_profile(profile_name)
             
             # Update the profile sliders
-            profile = profiles[profile_name]
-            self.profile_intensity_slider.setValueFloat(profile.get("intensity", 0.5))
-            self.profile_temp_slider.setValue(profile.get("color_temperature", 3500))
+            self._show_profile_settings(profile.get("intensity", 0.5), profile.get("color_temperature", 3500))
             
-            # Also update the main sliders
-            self.intensity_slider.setValueFloat(profile.get("intensity", 0.5))
-            self.temp_slider.setValue(profile.get("color_temperature", 3500))
+            # Also update the main sliders; the profile has already been applied to the filter
+            with QSignalBlocker(self.intensity_slider), QSignalBlocker(self.temp_slider):
+                self.intensity_slider.setValueFloat(profile.get("intensity", 0.5))
+                self.temp_slider.setValue(profile.get("color_temperature", 3500))
     
     def _create_new_profile(self):
         # Open a dialog to get the new profile name
@@ -410,11 +506,10 @@ class MainWindow(QMainWindow):
                 
                 # Update the profile list
                 self._load_profiles()
+                self.profilesChanged.emit()
                 
-                # Select the new profile
-                index = self.profile_combo.findText(profile_name)
-                if index >= 0:
-                    self.profile_combo.setCurrentIndex(index)
+                # Select the new profile; it is appended, or keeps its place if it was overwritten
+                self.profile_combo.setCurrentIndex(self._profile_index[profile_name])
     
     def _save_current_profile(self):
         profile_name = self.profile_combo.currentText()
@@ -428,16 +523,13 @@ class MainWindow(QMainWindow):
         # Save the profile
         self.profile_manager.save_profile(profile_name, intensity, color_temp)
         
-        # Update the main sliders if this is the active profile
-        active_profile = self.profile_manager.get_active_profile_name()
-        if profile_name == active_profile:
-            self.intensity_slider.setValueFloat(intensity)
-            self.temp_slider.setValue(color_temp)
-            
-            # Update the filter
-            if self.filter_manager.is_enabled():
-                self.filter_manager.set_intensity(intensity)
-                self.filter_manager.set_color_temperature(color_temp)
+        # The active profile's new values also go to the main sliders and the filter
+        if profile_name == self.profile_manager.get_active_profile_name():
+            with QSignalBlocker(self.intensity_slider), QSignalBlocker(self.temp_slider):
+                self.intensity_slider.setValueFloat(intensity)
+                self.temp_slider.setValue(color_temp)
+            self.filter_manager.set_intensity(intensity)
+            self.filter_manager.set_color_temperature(color_temp)
     
     def _delete_current_profile(self):
         profile_name = self.profile_combo.currentText()
@@ -458,23 +550,27 @@ class MainWindow(QMainWindow):
             
             # Update the profile list
             self._load_profiles()
+            self.profilesChanged.emit()
+            
+            # Deleting the active profile hands over to another one; apply it
+            self._on_profile_selected(self.profile_combo.currentText())
     
-    def _on_schedule_enabled_changed(self, state):
-        is_enabled = state == Qt.CheckState.Checked.value
+    def _on_schedule_enabled_changed(self, is_enabled):
         self.config_manager.set("schedule_enabled", is_enabled)
         self.scheduler.update_schedule()
     
     def _on_start_time_changed(self, time):
-        time_str = time.toString("HH:mm")
+        time_str = time.toString(_TIME_FMT)
         self.config_manager.set("schedule_start", time_str)
         self.scheduler.update_schedule()
     
     def _on_end_time_changed(self, time):
-        time_str = time.toString("HH:mm")
+        time_str = time.toString(_TIME_FMT)
         self.config_manager.set("schedule_end", time_str)
         self.scheduler.update_schedule()
     
     def closeEvent(self, event):
-        # Save configuration
-        self.config_manager.save()
+        # The window can be reopened from the tray, so keep the periodic flush
+        # running; write now only if there are unsaved changes (a no-op otherwise)
+        self.config_manager.flush()
         event.accept() 
\ No newline at end of file
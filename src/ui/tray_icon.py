@@ -1,8 +1,17 @@
 import logging
 import os
-from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QAction
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import pyqtSignal, QObject
+from functools import partial
+from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
+from PyQt6.QtGui import QIcon, QAction
+from PyQt6.QtCore import pyqtSignal, QObject, QTimer, QElapsedTimer
+
+# Icon files live in the resources directory at the repository root
+_RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "resources")
+_ICON_PATH = os.path.join(_RESOURCES_DIR, "icon.png")
+_ICON_ENABLED_PATH = os.path.join(_RESOURCES_DIR, "icon_enabled.png")
+
+# Minimum gap between two notification balloons; quicker ones are merged into the latest
+_NOTIFY_INTERVAL_MS = 500
 
 class TrayIcon(QSystemTrayIcon):
     def __init__(self, parent, filter_manager, config_manager, profile_manager):
@@ -12,27 +21,49 @@ class TrayIcon(QSystemTrayIcon):
         self.config_manager = config_manager
         self.profile_manager = profile_manager
         self.main_window = parent
+        self.toggle_action = None  # Created with the menu contents once the event loop starts
+        self._profiles_menu = None
+        self._profile_actions = {}  # Profile name -> its checkable menu action
+        
+        # Notifications shown too soon after the previous one wait for the timer,
+        # and only the most recent message is shown when it fires
+        self._notify_clock = QElapsedTimer()
+        self._pending_message = None
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.timeout.connect(self._show_pending_message)
+        
+        # Load the icons for both filter states once; toggling only swaps them
+        self._icon_on, self._icon_off = self._load_icons()
         
         # Initialize the tray icon
         self._create_tray_icon()
         
         # Connect activation signal (double click on tray icon)
         self.activated.connect(self._on_tray_icon_activated)
+        
+        # The profiles submenu only needs rebuilding when profiles are added or removed
+        self.main_window.profilesChanged.connect(self._on_profiles_changed)
     
     def _create_tray_icon(self):
         # Create tray icon with different icons for enabled/disabled states
         self._update_icon()
         
-        # Create the tray menu
-        self._create_tray_menu()
+        # Create the tray menu; its actions are filled in right after start-up rather
+        # than on first open, since some tray hosts never open an empty menu
+        self._menu = QMenu(self.main_window)
+        self.setContextMenu(self._menu)
         
-        # Show the tray icon
-        self.show()
+        # Build the menu and show the tray icon once the event loop is running;
+        # zero-delay timers fire in order, so the menu is ready before the icon appears
+        QTimer.singleShot(0, self._create_tray_menu)
+        QTimer.singleShot(0, self.show)
         self.logger.info("System tray icon initialized")
     
     def _create_tray_menu(self):
-        # Create menu
-        menu = QMenu(self.main_window)
+        # Refill the menu
+        menu = self._menu
+        menu.clear()
         
         # Toggle filter action
         self.toggle_action = QAction("Disable Filter" if self.filter_manager.is_enabled() else "Enable Filter", self.main_window)
@@ -43,8 +74,8 @@ class TrayIcon(QSystemTrayIcon):
         menu.addSeparator()
         
         # Profiles submenu
-        profiles_menu = menu.addMenu("Profiles")
-        self._populate_profiles_menu(profiles_menu)
+        self._profiles_menu = menu.addMenu("Profiles")
+        self._populate_profiles_menu(self._profiles_menu)
         
         # Add separator
         menu.addSeparator()
@@ -58,9 +89,6 @@ class TrayIcon(QSystemTrayIcon):
         exit_action = QAction("Exit", self.main_window)
         exit_action.triggered.connect(self._exit_application)
         menu.addAction(exit_action)
-        
-        # Set the menu for the tray icon
-        self.setContextMenu(menu)
     
     def _populate_profiles_menu(self, menu):
         # Clear existing items
@@ -70,31 +98,44 @@ class TrayIcon(QSystemTrayIcon):
         profiles = self.profile_manager.get_all_profiles()
         active_profile = self.profile_manager.get_active_profile_name()
         
-        # Add profile actions
+        # Add profile actions; parented to the menu so clear() deletes them
+        self._profile_actions = {}
         for profile_name in profiles:
-            action = QAction(profile_name, self.main_window)
+            action = QAction(profile_name, menu)
             action.setCheckable(True)
             action.setChecked(profile_name == active_profile)
             
-            # Use a lambda with default args to capture the profile name
-            action.triggered.connect(lambda checked, name=profile_name: self._activate_profile(name))
+            # Bind the profile name; triggered passes the checked state after it
+            action.triggered.connect(partial(self._activate_profile, profile_name))
             menu.addAction(action)
+            self._profile_actions[profile_name] = action
     
-    def _update_icon(self):
-        # Set the appropriate icon based on filter state
-        icon_name = "icon_enabled.png" if self.filter_manager.is_enabled() else "icon.png"
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                               "resources", icon_name)
+    def _on_profiles_changed(self):
+        # Rebuild the profiles submenu if the menu has been built already
+        if self._profiles_menu is not None:
+            self._populate_profiles_menu(self._profiles_menu)
+    
+    def _load_icons(self):
+        # Load the (enabled, disabled) icons, or None where no icon file exists
+        off_path = _ICON_PATH
+        on_path = _ICON_ENABLED_PATH
+        
+        if not os.path.exists(off_path):
+            self.logger.warning(f"Icon file not found: {off_path}")
+            off_path = None
         
         # Use default icon if the specific icon doesn't exist
-        if not os.path.exists(icon_path):
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                                 "resources", "icon.png")
+        if not os.path.exists(on_path):
+            on_path = off_path
         
-        if os.path.exists(icon_path):
-            self.setIcon(QIcon(icon_path))
-        else:
-            self.logger.warning(f"Icon file not found: {icon_path}")
+        return (QIcon(on_path) if on_path else None,
+                QIcon(off_path) if off_path else None)
+    
+    def _update_icon(self):
+        # Set the appropriate icon based on filter state
+        icon = self._icon_on if self.filter_manager.is_enabled() else self._icon_off
+        if icon is not None:
+            self.setIcon(icon)
     
     def _on_tray_icon_activated(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
@@ -113,12 +154,9 @@ class TrayIcon(QSystemTrayIcon):
         self._update_ui()
         
         # Show notification
-        self.showMessage("OpenBlueFilter", 
-                        "Blue light filter enabled" if self.filter_manager.is_enabled() else "Blue light filter disabled",
-                        QSystemTrayIcon.MessageIcon.Information, 
-                        2000)
+        self._notify("Blue light filter enabled" if self.filter_manager.is_enabled() else "Blue light filter disabled")
     
-    def _activate_profile(self, profile_name):
+    def _activate_profile(self, profile_name, checked=False):
         # Activate the selected profile
         self.profile_manager.activate_profile(profile_name)
         
@@ -126,12 +164,28 @@ class TrayIcon(QSystemTrayIcon):
         if self.filter_manager.is_enabled():
             self.filter_manager.apply_config()
         
-        # Recreate the menu to update checkmarks
-        self._create_tray_menu()
+        # Move the checkmark to the activated profile
+        self._refresh_profile_checkmarks()
         
         # Show notification
+        self._notify(f"Profile '{profile_name}' activated")
+    
+    def _notify(self, message):
+        # Rate-limit balloons so rapid clicks don't flood the notification daemon
+        self._pending_message = message
+        if self._notify_timer.isActive():
+            return
+        
+        remaining = _NOTIFY_INTERVAL_MS - self._notify_clock.elapsed() if self._notify_clock.isValid() else 0
+        if remaining > 0:
+            self._notify_timer.start(remaining)
+        else:
+            self._show_pending_message()
+    
+    def _show_pending_message(self):
+        self._notify_clock.start()
         self.showMessage("OpenBlueFilter", 
-                        f"Profile '{profile_name}' activated",
+                        self._pending_message,
                         QSystemTrayIcon.MessageIcon.Information, 
                         2000)
     
@@ -155,12 +209,16 @@ class TrayIcon(QSystemTrayIcon):
         # Update tray icon
         self._update_icon()
         
-        # Update toggle action text
+        # Update the existing menu in place, if it has been built already
         if self.toggle_action:
             self.toggle_action.setText("Disable Filter" if self.filter_manager.is_enabled() else "Enable Filter")
-        
-        # Recreate the menu
-        self._create_tray_menu()
+            self._refresh_profile_checkmarks()
+    
+    def _refresh_profile_checkmarks(self):
+        # Check only the active profile's action
+        active_profile = self.profile_manager.get_active_profile_name()
+        for name, action in self._profile_actions.items():
+            action.setChecked(name == active_profile)
     
     def update(self):
         # Update the tray icon and menu
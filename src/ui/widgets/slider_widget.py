@@ -7,8 +7,8 @@ class LabeledSlider(QWidget):
     def __init__(self, label_text, min_value=0, max_value=100, initial_value=50, parent=None):
         super().__init__(parent)
         
-        # Main layout
-        main_layout = QVBoxLayout()
+        # Main layout, installed on this widget directly
+        main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
         # Label
@@ -33,7 +33,6 @@ class LabeledSlider(QWidget):
         slider_layout.addWidget(self.value_label, 1)
         
         main_layout.addLayout(slider_layout)
-        self.setLayout(main_layout)
     
     def _on_value_changed(self, value):
         self.value_label.setText(str(value))
@@ -56,16 +55,13 @@ class PercentageSlider(LabeledSlider):
     def __init__(self, label_text, min_percent=0, max_percent=100, initial_percent=50, parent=None):
         super().__init__(label_text, min_percent, max_percent, initial_percent, parent)
         self.value_label.setText(f"{initial_percent}%")
-        self.slider.valueChanged.connect(self._emit_float_value)
     
     def _on_value_changed(self, value):
         self.value_label.setText(f"{value}%")
         self.valueChanged.emit(value)
-    
-    def _emit_float_value(self, value):
-        # Convert percentage to float (0.0 to 1.0)
-        float_value = value / 100.0
-        self.valueChangedFloat.emit(float_value)
+        
+        # Also emit the percentage as a float (0.0 to 1.0)
+        self.valueChangedFloat.emit(value / 100.0)
     
     def setValueFloat(self, float_value):
         # Convert float (0.0 to 1.0) to percentage (0 to 100)
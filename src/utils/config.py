@@ -1,123 +1,280 @@
+import atexit
+import functools
 import json
 import os
 import logging
-from pathlib import Path
+import threading
+import types
+from contextlib import contextmanager
 
-class ConfigManager:
-    DEFAULT_CONFIG = {
-        "filter_enabled": False,
-        "intensity": 0.5,  # 0.0 to 1.0
-        "color_temperature": 3500,  # Kelvin (lower = warmer)
-        "start_with_system": False,
-        "schedule_enabled": False,
-        "schedule_start": "20:00",  # 24-hour format
-        "schedule_end": "07:00",
-        "auto_adjust_with_sunset": False,
-        "location": {
-            "latitude": None,
-            "longitude": None
+from .paths import APP_DIR, ensure_app_dirs
+
+# Marks a key with no value in get(), where None is a valid stored value
+_MISSING = object()
+
+# Use orjson for the config file when it is installed; both paths write 2-space indented JSON bytes
+try:
+    import orjson
+
+    def _dump_json(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _load_json = orjson.loads
+except ImportError:
+    def _dump_json(data):
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    _load_json = json.loads
+
+# Settings used for any key the config file doesn't have
+_DEFAULT_CONFIG = {
+    "filter_enabled": False,
+    "intensity": 0.5,  # 0.0 to 1.0
+    "color_temperature": 3500,  # Kelvin (lower = warmer)
+    "start_with_system": False,
+    "schedule_enabled": False,
+    "schedule_start": "20:00",  # 24-hour format
+    "schedule_end": "07:00",
+    "auto_adjust_with_sunset": False,
+    "location": {
+        "latitude": None,
+        "longitude": None
+    },
+    "profiles": {
+        "Day": {
+            "intensity": 0.3,
+            "color_temperature": 4500
         },
-        "profiles": {
-            "Day": {
-                "intensity": 0.3,
-                "color_temperature": 4500
-            },
-            "Evening": {
-                "intensity": 0.6,
-                "color_temperature": 3200
-            },
-            "Night": {
-                "intensity": 0.8,
-                "color_temperature": 2700
-            }
+        "Evening": {
+            "intensity": 0.6,
+            "color_temperature": 3200
         },
-        "active_profile": "Day"
-    }
+        "Night": {
+            "intensity": 0.8,
+            "color_temperature": 2700
+        }
+    },
+    "active_profile": "Day"
+}
+
+# The defaults serialized once; loading them gives each config its own deep copy,
+# so nothing written into a config can reach the defaults
+_DEFAULT_BYTES = json.dumps(_DEFAULT_CONFIG).encode("utf-8")
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key):
+    # Dotted keys come from a small fixed set, so each is only split once
+    return tuple(key.split('.'))
+
+class ConfigManager:
+    __slots__ = (
+        "logger", "config_dir", "config_file", "_batch_depth", "_batch_pending",
+        "_dirty", "_lock", "_save_timer", "_config", "_flat", "_last_hash",
+    )
+    
+    # Read-only view; each loaded config gets its own copy built from _DEFAULT_BYTES
+    DEFAULT_CONFIG = types.MappingProxyType(_DEFAULT_CONFIG)
+    
+    # Seconds of inactivity after the last change before it is written
+    SAVE_DELAY = 0.3
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.config_dir = Path.home() / ".openbluefilter"
+        self.config_dir = APP_DIR
         self.config_file = self.config_dir / "config.json"
-        self.config = self._load_config()
+        self._batch_depth = 0
+        self._batch_pending = False
+        self._dirty = False  # In-memory changes not yet written to disk
+        self._lock = threading.Lock()  # Saves may run on the timer or a shutdown thread
+        self._save_timer = None
+        self._config = None  # Read from disk on first access
+        self._flat = None  # Dotted key -> value for every nested entry, built on first get()
+        self._last_hash = None  # Hash of the bytes last written, to skip rewriting identical content
+        
+        # Write any changes still waiting on the timer when the app exits
+        atexit.register(self.flush)
+    
+    @property
+    def config(self):
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
     
     def _load_config(self):
-        os.makedirs(self.config_dir, exist_ok=True)
+        ensure_app_dirs()
         
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                
-                # Ensure all default keys exist in loaded config
-                updated_config = self.DEFAULT_CONFIG.copy()
+        try:
+            with open(self.config_file, 'rb') as f:
+                config = _load_json(f.read())
+            
+            # Ensure all default keys exist in loaded config; a plain merge is enough
+            # unless the file overrides part of one of the nested defaults
+            defaults = self.DEFAULT_CONFIG
+            updated_config = json.loads(_DEFAULT_BYTES)
+            if any(type(v) is dict and type(defaults.get(k)) is dict for k, v in config.items()):
                 self._update_nested_dict(updated_config, config)
-                
-                self.logger.info("Configuration loaded successfully")
-                return updated_config
-            except Exception as e:
-                self.logger.error(f"Error loading config: {e}")
-                return self.DEFAULT_CONFIG.copy()
-        else:
+            else:
+                updated_config.update(config)
+            
+            self.logger.info("Configuration loaded successfully")
+            return updated_config
+        except FileNotFoundError:
             self.logger.info("Config file not found, creating default configuration")
-            self._save_config(self.DEFAULT_CONFIG)
-            return self.DEFAULT_CONFIG.copy()
+            self._save_config(_DEFAULT_CONFIG)
+            return json.loads(_DEFAULT_BYTES)
+        except Exception as e:
+            self.logger.error("Error loading config: %s", e)
+            return json.loads(_DEFAULT_BYTES)
     
     def _update_nested_dict(self, d, u):
-        for k, v in u.items():
-            if isinstance(v, dict) and k in d and isinstance(d[k], dict):
-                self._update_nested_dict(d[k], v)
-            else:
-                d[k] = v
+        # Walk nested dicts with an explicit stack; only dicts present on both sides are merged
+        stack = [(d, u)]
+        while stack:
+            dst, src = stack.pop()
+            for k, v in src.items():
+                dv = dst.get(k)
+                if type(v) is dict and type(dv) is dict:
+                    stack.append((dv, v))
+                else:
+                    dst[k] = v
     
     def _save_config(self, config=None):
-        if config is None:
+        saving_current = config is None
+        if saving_current:
             config = self.config
             
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            blob = _dump_json(config)
+            blob_hash = hash(blob)
+            if blob_hash == self._last_hash:
+                # The file already holds exactly this content
+                if saving_current:
+                    self._dirty = False
+                return True
+            
+            # Write a sibling file and swap it in, so a crash mid-write never
+            # leaves a truncated config behind
+            tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            self._last_hash = blob_hash
+            if saving_current:
+                self._dirty = False
             self.logger.info("Configuration saved successfully")
             return True
         except Exception as e:
-            self.logger.error(f"Error saving config: {e}")
+            self.logger.error("Error saving config: %s", e)
             return False
     
-    def get(self, key, default=None):
-        keys = key.split('.')
-        value = self.config
+    def _schedule_save(self):
+        """Mark the config dirty and restart the save timer, so a burst of changes produces a single write"""
+        self._dirty = True
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-                
-        return value
+        # Inside a batch, write once when the outermost batch ends
+        if self._batch_depth:
+            self._batch_pending = True
+            return
+        
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
+    @contextmanager
+    def batch(self):
+        """Coalesce all saves made inside the block into a single write"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_pending:
+                self._batch_pending = False
+                self.save()
     
-    def set(self, key, value):
-        keys = key.split('.')
-        config = self.config
+    def _flat_index(self):
+        # Index every value under its dotted path; nested dicts are indexed too,
+        # and share identity with the ones in self.config
+        flat = {}
+        stack = [("", self.config)]
+        while stack:
+            prefix, node = stack.pop()
+            for k, v in node.items():
+                path = prefix + k
+                flat[path] = v
+                if type(v) is dict:
+                    stack.append((path + ".", v))
+        self._flat = flat
+        return flat
+    
+    def get(self, key, default=None):
+        flat = self._flat
+        if flat is None:
+            flat = self._flat_index()
+        return flat.get(key, default)
+    
+    def set(self, key, value, persist=True):
+        # Re-setting the current value changes nothing in memory; containers
+        # may have been edited in place, so those are always written
+        if type(value) not in (dict, list) and self.get(key, _MISSING) == value:
+            # The value may still be unsaved from an earlier persist=False call
+            if persist and self._dirty:
+                self._schedule_save()
+            return
         
-        # Navigate to the innermost dictionary
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+        keys = _split_key(key)
         
-        # Set the value
-        config[keys[-1]] = value
-        self._save_config()
+        with self._lock:
+            config = self.config
+            reshaped = type(value) is dict
+            
+            # Navigate to the innermost dictionary
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                    reshaped = True
+                config = config[k]
+            
+            # Set the value
+            reshaped = reshaped or type(config.get(keys[-1])) is dict
+            config[keys[-1]] = value
+            
+            # Replacing one plain value with another only touches its own entry;
+            # anything that adds or removes dicts rebuilds the index on the next get()
+            if self._flat is not None:
+                if reshaped:
+                    self._flat = None
+                else:
+                    self._flat[key] = value
+        
+        # Callers that update at a high rate (e.g. slider drags) pass
+        # persist=False and rely on flush() or save() to write the change later
+        if persist:
+            self._schedule_save()
+        else:
+            self._dirty = True
     
     def save_profile(self, profile_name, settings):
-        if "profiles" not in self.config:
-            self.config["profiles"] = {}
-            
-        self.config["profiles"][profile_name] = settings
-        self._save_config()
+        self.save_profiles({profile_name: settings})
+    
+    def save_profiles(self, profiles):
+        """Add or replace several profiles at once, with a single save"""
+        with self._lock:
+            self.config.setdefault("profiles", {}).update(profiles)
+            self._flat = None
+        self._schedule_save()
         
     def delete_profile(self, profile_name):
-        if "profiles" in self.config and profile_name in self.config["profiles"]:
+        with self._lock:
+            if "profiles" not in self.config or profile_name not in self.config["profiles"]:
+                return False
+            
             del self.config["profiles"][profile_name]
+            self._flat = None
             
             # Reset active profile if it was deleted
             if self.config.get("active_profile") == profile_name:
@@ -126,12 +283,28 @@ class ConfigManager:
                 else:
                     self.config["active_profile"] = None
                     
-            self._save_config()
-            return True
-        return False
+        self._schedule_save()
+        return True
     
     def get_all_profiles(self):
         return self.config.get("profiles", {})
     
     def save(self):
-        return self._save_config() 
\ No newline at end of file
+        """Write the configuration now, replacing any pending delayed save"""
+        # Inside a batch, write once when the outermost batch ends
+        if self._batch_depth:
+            self._batch_pending = True
+            return True
+        
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        with self._lock:
+            return self._save_config()
+    
+    def flush(self):
+        """Write the configuration only if it has unsaved changes"""
+        with self._lock:
+            if not self._dirty:
+                return True
+            return self._save_config()
@@ -1,16 +1,25 @@
+import atexit
 import logging
-import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from .paths import LOG_DIR, ensure_app_dirs
+
+# Set once the root logger has its handlers, so repeated setup doesn't duplicate every line
+_configured = False
 
 def setup_logger():
+    global _configured
+    logger = logging.getLogger()
+    if _configured:
+        return logger
+    
     # Create logs directory if it doesn't exist
-    log_dir = Path.home() / ".openbluefilter" / "logs"
-    os.makedirs(log_dir, exist_ok=True)
+    log_dir = LOG_DIR
+    ensure_app_dirs()
     
     # Configure root logger
-    logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     
     # Format for logs
@@ -18,20 +27,32 @@ def setup_logger():
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     
-    # File handler for debug logs
+    # File handler; the file is opened on the first record, not here
     file_handler = RotatingFileHandler(
         log_dir / "openbluefilter.log",
         maxBytes=5 * 1024 * 1024,  # 5 MB
-        backupCount=3
+        backupCount=3,
+        delay=True
     )
     file_handler.setFormatter(log_format)
-    file_handler.setLevel(logging.DEBUG)
-    logger.addHandler(file_handler)
+    # The root logger already drops DEBUG records before they are formatted, so match its level
+    file_handler.setLevel(logging.INFO)
     
     # Console handler for info+ logs
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(log_format)
     console_handler.setLevel(logging.INFO)
-    logger.addHandler(console_handler)
     
+    # Logging calls only merge the message arguments (and any traceback) into the record
+    # and enqueue it; a background listener thread applies the log format and does the
+    # writes, so a slow disk or console never blocks the GUI
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    
+    # Drain the queue on exit; this runs before logging's own shutdown closes the handlers
+    atexit.register(listener.stop)
+    
+    _configured = True
     return logger 
\ No newline at end of file
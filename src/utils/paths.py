@@ -0,0 +1,16 @@
+import os
+from pathlib import Path
+
+# Per-user directories for the config file and the logs, resolved once at import
+APP_DIR = Path.home() / ".openbluefilter"
+LOG_DIR = APP_DIR / "logs"
+
+# Set once the directories have been created in this process
+_dirs_created = False
+
+def ensure_app_dirs():
+    """Create the app and log directories, at most once per process"""
+    global _dirs_created
+    if not _dirs_created:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        _dirs_created = True